@@ -1,12 +1,26 @@
+import logging
 from contextlib import asynccontextmanager
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from config import settings
-from security import SecurityHeadersMiddleware
+from security import SecurityHeadersMiddleware, CachedCORSMiddleware, CompressionMiddleware
+from services import get_http_client, close_http_client
 from routes import health_router, verify_router, scan_router
 
+logger = logging.getLogger("trace")
+
+# Settings are read-only after startup; bind what this module uses once
+VERSION = settings.VERSION
+ENVIRONMENT = settings.ENVIRONMENT
+DEBUG = settings.DEBUG
+CORS_ORIGINS = tuple(settings.CORS_ORIGINS)
+HOST, PORT = settings.HOST, settings.PORT
+
+# Body for unhandled errors, encoded once
+_ERR_500_BODY = orjson.dumps({"success": False, "error": "Internal error"})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -14,39 +28,43 @@ async def lifespan(app: FastAPI):
 +======================================================+
 |                                                      |
 |   TRACE BACKEND                                      |
-|   v{settings.VERSION}                                            |
+|   v{VERSION}                                            |
 |                                                      |
-|   Environment: {settings.ENVIRONMENT:<15}               |
+|   Environment: {ENVIRONMENT:<15}               |
 |   Data Retention: NONE                               |
 |                                                      |
 +======================================================+
     """)
+    get_http_client()
     yield
+    await close_http_client()
     print("\n[TRACE] Shutdown. Memory cleared.\n")
 
 
 app = FastAPI(
     title="TRACE API",
-    version=settings.VERSION,
-    docs_url="/docs" if settings.DEBUG else None,
+    version=VERSION,
+    docs_url="/docs" if DEBUG else None,
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.CORS_ORIGINS,
+    CachedCORSMiddleware,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST"],
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware, minimum_size=1024, compresslevel=5)
 
 
 @app.exception_handler(Exception)
 async def error_handler(request: Request, exc: Exception):
-    print(f"[ERROR] {type(exc).__name__}: {exc}")
-    return JSONResponse(status_code=500, content={"success": False, "error": "Internal error"})
+    logger.error("%s: %s", type(exc).__name__, exc)
+    return Response(_ERR_500_BODY, status_code=500, media_type="application/json")
 
 
 app.include_router(health_router, prefix="/api")
@@ -56,9 +74,20 @@ app.include_router(scan_router, prefix="/api")
 
 @app.get("/")
 async def root():
-    return {"name": "TRACE API", "version": settings.VERSION, "status": "ok"}
+    return {"name": "TRACE API", "version": VERSION, "status": "ok"}
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run("main:app", host=settings.HOST, port=settings.PORT, reload=True)
+
+    # uvloop/httptools ship with uvicorn[standard]; uvloop has no Windows build
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    uvicorn.run(
+        "main:app",
+        host=HOST,
+        port=PORT,
+        reload=True,
+        loop=loop,
+        http="httptools",
+    )
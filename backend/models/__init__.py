@@ -1,9 +1,9 @@
 from .requests import VerifySendRequest, VerifyConfirmRequest, ScanRequest
 from .responses import VerifySendResponse, VerifyConfirmResponse, ErrorResponse, HealthResponse
-from .findings import Finding, Severity, NodeType
+from .findings import Finding, Severity, NodeType, finding_id
 
 __all__ = [
     "VerifySendRequest", "VerifyConfirmRequest", "ScanRequest",
     "VerifySendResponse", "VerifyConfirmResponse", "ErrorResponse", "HealthResponse",
-    "Finding", "Severity", "NodeType",
+    "Finding", "Severity", "NodeType", "finding_id",
 ]
@@ -1,10 +1,22 @@
 """Data models for OSINT findings."""
 
-from pydantic import BaseModel
+import itertools
+import os
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 from enum import Enum
 
+# Graph node IDs only need to be unique within a process' scans, so use a
+# random per-process prefix plus a counter instead of a uuid4 per finding.
+_ID_PREFIX = os.urandom(6).hex()
+_next_id = itertools.count().__next__
+
+
+def finding_id() -> str:
+    """Return a new process-unique finding ID."""
+    return f"{_ID_PREFIX}{_next_id():x}"
+
 
 class Severity(str, Enum):
     CRITICAL = "critical"
@@ -24,6 +36,11 @@ class NodeType(str, Enum):
 
 class Finding(BaseModel):
     """A single OSINT finding / graph node."""
+    model_config = ConfigDict(
+        use_enum_values=True,
+        extra="forbid",
+    )
+
     id: str
     type: NodeType
     severity: Severity
@@ -36,5 +53,17 @@ class Finding(BaseModel):
     parent_id: Optional[str] = None
     link_label: Optional[str] = None
 
-    class Config:
-        use_enum_values = True
+    @classmethod
+    def build(cls, **fields) -> "Finding":
+        """
+        Construct a Finding from trusted, module-built data without validation.
+
+        Enum members are stored by value (matching use_enum_values). Callers
+        pass id and timestamp explicitly, since nothing checks required fields.
+        Untrusted input must go through the normal constructor instead.
+        """
+        for key in ("type", "severity"):
+            value = fields.get(key)
+            if isinstance(value, Enum):
+                fields[key] = value.value
+        return cls.model_construct(**fields)
@@ -1,13 +1,18 @@
 """OSINT package."""
 
-from .modules import (
-    OSINTModule,
-    ALL_MODULES,
-    USERNAME_MODULES,
-)
+from . import modules
+from .modules import OSINTModule
 from .orchestrator import ScanOrchestrator
 from .risk import calculate_risk_score, get_risk_bar
 
+
+def __getattr__(name: str):
+    # Module lists resolve (and import their modules) lazily
+    if name in ("ALL_MODULES", "USERNAME_MODULES"):
+        return getattr(modules, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "OSINTModule",
     "ALL_MODULES",
@@ -1,82 +1,117 @@
-"""OSINT modules registry - Aggressive Deep Scan with Username Discovery."""
+"""OSINT modules registry - Aggressive Deep Scan with Username Discovery.
+
+Module classes are imported lazily (PEP 562): the registry below only maps
+names to submodules, and each submodule is loaded the first time its class
+is accessed. Workers that never run a scan never import them.
+"""
+
+import importlib
 
 from .base import OSINTModule
 
-# Core modules
-from .username_extractor import UsernameExtractor
-from .username_checker import UsernameChecker
-from .breach_lookup import BreachLookup
-from .gravatar import GravatarLookup
-from .github import GitHubLookup
-from .whois_lookup import WhoisLookup
-from .pgp_keys import PGPKeysLookup
-
-# Deep scan modules
-from .email_checker import EmailChecker
-from .profile_scraper import ProfileScraper
-from .connected_accounts import ConnectedAccountFinder
-from .location_inference import LocationInference
-from .data_broker_check import DataBrokerCheck
-
-# Aggressive modules
-from .google_dork import GoogleDork
-from .paste_search import PasteSearch
-from .reverse_lookup import ReverseLookup
-from .wayback import WaybackLookup
-from .github_secrets import GitHubSecrets
-from .epieos import EpieosLookup
-from .social_deep import SocialDeepDive
-
-# Username discovery modules (find REAL usernames from email)
-from .github_email_search import GitHubEmailSearch
-from .keybase import KeybaseLookup
-from .intelx import IntelXSearch
-from .hudsonrock import HudsonRockSearch
-
-# Aliases
-Gravatar = GravatarLookup
-PGPKeys = PGPKeysLookup
-
-# HOP 1: Direct Email Intelligence + Username Discovery
-HOP1_MODULES = [
-    # Direct email analysis
-    BreachLookup,        # XposedOrNot breaches
-    EpieosLookup,        # Google account, service checks
-    ReverseLookup,       # EmailRep, ThatsThem
-    GoogleDork,          # Document/paste search
-    PasteSearch,         # Paste/leak site search
-    GravatarLookup,      # Gravatar profile + username extraction
-    UsernameExtractor,   # Extract username patterns from email
-
-    # Username discovery (finds REAL usernames, not just email prefix)
-    GitHubEmailSearch,   # Find GitHub users by commit email
-    KeybaseLookup,       # Keybase verified proofs (Twitter, GitHub, Reddit)
-    IntelXSearch,        # IntelX leaked database search
-    HudsonRockSearch,    # Stealer malware log search
-]
+# Class name -> (submodule, attribute)
+_MODULE_MAP = {
+    # Core modules
+    "UsernameExtractor": (".username_extractor", "UsernameExtractor"),
+    "UsernameChecker": (".username_checker", "UsernameChecker"),
+    "BreachLookup": (".breach_lookup", "BreachLookup"),
+    "GravatarLookup": (".gravatar", "GravatarLookup"),
+    "GitHubLookup": (".github", "GitHubLookup"),
+    "WhoisLookup": (".whois_lookup", "WhoisLookup"),
+    "PGPKeysLookup": (".pgp_keys", "PGPKeysLookup"),
 
-# HOP 2: Username Expansion
-HOP2_MODULES = [
-    UsernameChecker,     # Platform account check
-    GitHubLookup,        # GitHub deep scan
-    GitHubSecrets,       # GitHub secrets scanner
-    SocialDeepDive,      # Reddit/Twitter deep dive
-    WaybackLookup,       # Archive.org search
-    ProfileScraper,      # Legacy profile scraper
-]
+    # Deep scan modules
+    "EmailChecker": (".email_checker", "EmailChecker"),
+    "ProfileScraper": (".profile_scraper", "ProfileScraper"),
+    "ConnectedAccountFinder": (".connected_accounts", "ConnectedAccountFinder"),
+    "LocationInference": (".location_inference", "LocationInference"),
+    "DataBrokerCheck": (".data_broker_check", "DataBrokerCheck"),
 
-# HOP 3: Aggregation & Correlation
-HOP3_MODULES = [
-    DataBrokerCheck,     # Data broker warnings
-    LocationInference,   # Location aggregation
-    ConnectedAccountFinder,  # Cross-platform correlation
-]
+    # Aggressive modules
+    "GoogleDork": (".google_dork", "GoogleDork"),
+    "PasteSearch": (".paste_search", "PasteSearch"),
+    "ReverseLookup": (".reverse_lookup", "ReverseLookup"),
+    "WaybackLookup": (".wayback", "WaybackLookup"),
+    "GitHubSecrets": (".github_secrets", "GitHubSecrets"),
+    "EpieosLookup": (".epieos", "EpieosLookup"),
+    "SocialDeepDive": (".social_deep", "SocialDeepDive"),
+
+    # Username discovery modules (find REAL usernames from email)
+    "GitHubEmailSearch": (".github_email_search", "GitHubEmailSearch"),
+    "KeybaseLookup": (".keybase", "KeybaseLookup"),
+    "IntelXSearch": (".intelx", "IntelXSearch"),
+    "HudsonRockSearch": (".hudsonrock", "HudsonRockSearch"),
+
+    # Aliases
+    "Gravatar": (".gravatar", "GravatarLookup"),
+    "PGPKeys": (".pgp_keys", "PGPKeysLookup"),
+}
+
+# Module lists hold class names; they are resolved to classes on first access
+_MODULE_LISTS = {
+    # HOP 1: Direct Email Intelligence + Username Discovery
+    "HOP1_MODULES": (
+        # Direct email analysis
+        "BreachLookup",        # XposedOrNot breaches
+        "EpieosLookup",        # Google account, service checks
+        "ReverseLookup",       # EmailRep, ThatsThem
+        "GoogleDork",          # Document/paste search
+        "PasteSearch",         # Paste/leak site search
+        "GravatarLookup",      # Gravatar profile + username extraction
+        "UsernameExtractor",   # Extract username patterns from email
+
+        # Username discovery (finds REAL usernames, not just email prefix)
+        "GitHubEmailSearch",   # Find GitHub users by commit email
+        "KeybaseLookup",       # Keybase verified proofs (Twitter, GitHub, Reddit)
+        "IntelXSearch",        # IntelX leaked database search
+        "HudsonRockSearch",    # Stealer malware log search
+    ),
+
+    # HOP 2: Username Expansion
+    "HOP2_MODULES": (
+        "UsernameChecker",     # Platform account check
+        "GitHubLookup",        # GitHub deep scan
+        "GitHubSecrets",       # GitHub secrets scanner
+        "SocialDeepDive",      # Reddit/Twitter deep dive
+        "WaybackLookup",       # Archive.org search
+        "ProfileScraper",      # Legacy profile scraper
+    ),
+
+    # HOP 3: Aggregation & Correlation
+    "HOP3_MODULES": (
+        "DataBrokerCheck",     # Data broker warnings
+        "LocationInference",   # Location aggregation
+        "ConnectedAccountFinder",  # Cross-platform correlation
+    ),
+}
 
 # Legacy compatibility
-EMAIL_MODULES = HOP1_MODULES
-USERNAME_MODULES = HOP2_MODULES
-CORRELATION_MODULES = HOP3_MODULES
-ALL_MODULES = HOP1_MODULES
+_LIST_ALIASES = {
+    "EMAIL_MODULES": "HOP1_MODULES",
+    "USERNAME_MODULES": "HOP2_MODULES",
+    "CORRELATION_MODULES": "HOP3_MODULES",
+    "ALL_MODULES": "HOP1_MODULES",
+}
+
+
+def __getattr__(name: str):
+    if name in _MODULE_MAP:
+        submodule, attr = _MODULE_MAP[name]
+        value = getattr(importlib.import_module(submodule, __name__), attr)
+    elif name in _MODULE_LISTS:
+        value = [__getattr__(cls_name) for cls_name in _MODULE_LISTS[name]]
+    elif name in _LIST_ALIASES:
+        value = globals().get(_LIST_ALIASES[name]) or __getattr__(_LIST_ALIASES[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULE_MAP) | set(_MODULE_LISTS) | set(_LIST_ALIASES))
+
 
 __all__ = [
     "OSINTModule",
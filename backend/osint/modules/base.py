@@ -1,9 +1,13 @@
 """Base class for OSINT modules."""
 
+import re
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator
 from models.findings import Finding
 
+# Cheap shape check for email seeds; rejects input before any network I/O
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class OSINTModule(ABC):
     """
@@ -16,6 +20,9 @@ class OSINTModule(ABC):
     - Respects rate limits
     """
 
+    # Empty so subclasses that declare __slots__ carry no instance __dict__
+    __slots__ = ()
+
     name: str = "Base Module"
     description: str = "Base OSINT module"
 
@@ -38,3 +45,31 @@ class OSINTModule(ABC):
             Finding objects as discovered
         """
         pass
+
+    async def run_batches(
+        self,
+        seed: str,
+        depth: int,
+        parent_id: str | None = None,
+        size: int = 16,
+    ) -> AsyncGenerator[list[Finding], None]:
+        """
+        Execute the lookup, yielding findings in lists of up to `size`.
+
+        Groups run()'s output; the orchestrator passes each list on to the
+        scan stream as soon as it is full, instead of after the module ends.
+        """
+        batch: list[Finding] = []
+        try:
+            async for finding in self.run(seed, depth, parent_id):
+                batch.append(finding)
+                if len(batch) >= size:
+                    yield batch
+                    batch = []
+        except Exception:
+            # Hand over what was found before the error, then re-raise
+            if batch:
+                yield batch
+            raise
+        if batch:
+            yield batch
@@ -4,16 +4,58 @@ Free API, no key required, 1 req/sec rate limit.
 Docs: https://xposedornot.com/api_doc
 """
 
+import re
 import httpx
-import uuid
+import orjson
 from typing import AsyncGenerator
 from datetime import datetime
 
-from .base import OSINTModule
-from models.findings import Finding, NodeType, Severity
+from .base import OSINTModule, EMAIL_RE
+from models.findings import Finding, NodeType, Severity, finding_id
+from services.http import get_http_client
+
+# Enum values resolved once; Finding.build stores them as-is
+_NT_BREACH = NodeType.BREACH.value
+_SEV = {s: s.value for s in Severity}
+
+# Fixed-content status findings; only id, timestamp and parent vary per scan
+_STATUS_FINDINGS = {
+    "clean": {
+        "title": "No Breaches Found",
+        "description": "Email not found in any known data breaches",
+        "source_url": "https://xposedornot.com",
+        "data": {"status": "clean", "breaches_found": 0},
+        "link_label": "checked against",
+    },
+    "rate_limited": {
+        "title": "Breach Check Rate Limited",
+        "description": "Too many requests, try again later",
+        "data": {"status": "rate_limited"},
+        "link_label": "rate limited",
+    },
+    "timeout": {
+        "title": "Breach Check Timeout",
+        "description": "Request timed out, try again later",
+        "data": {"status": "timeout"},
+        "link_label": "timeout",
+    },
+}
+
+# Every severity term in one alternation, so a single scan over a breach's
+# exposed data types reports all tiers present
+_SEVERITY_RE = re.compile(
+    r"(?P<critical>ssn|social security|credit card|bank account|financial|tax|passport)"
+    r"|(?P<password>password)"
+    r"|(?P<phone>phone)"
+    r"|(?P<address>address)"
+    r"|(?P<medium>dob|date of birth|birthday)",
+    re.IGNORECASE,
+)
 
 
 class BreachLookup(OSINTModule):
+    __slots__ = ("timeout",)
+
     name = "Breach Lookup"
     description = "Check for data breaches via XposedOrNot"
 
@@ -24,35 +66,175 @@ class BreachLookup(OSINTModule):
 
     def _determine_severity(self, data_exposed: list[str], password_risk: str | None) -> Severity:
         """Determine severity based on exposed data types."""
-        data_lower = [d.lower() for d in data_exposed]
-
         # CRITICAL: plaintext passwords, SSN, financial
-        critical_indicators = [
-            "plaintext" in (password_risk or "").lower(),
-            any(term in " ".join(data_lower) for term in [
-                "ssn", "social security", "credit card", "bank account",
-                "financial", "tax", "passport"
-            ])
-        ]
-        if any(critical_indicators):
+        if password_risk and "plaintext" in password_risk.lower():
             return Severity.CRITICAL
 
-        # HIGH: any passwords, or phone+address combo
-        has_password = any("password" in d for d in data_lower) or password_risk
-        has_phone = any("phone" in d for d in data_lower)
-        has_address = any("address" in d for d in data_lower)
+        found = set()
+        for match in _SEVERITY_RE.finditer("\n".join(data_exposed)):
+            if match.lastgroup == "critical":
+                return Severity.CRITICAL
+            found.add(match.lastgroup)
 
-        if has_password or (has_phone and has_address):
+        # HIGH: any passwords, or phone+address combo
+        if password_risk or "password" in found or {"phone", "address"} <= found:
             return Severity.HIGH
 
         # MEDIUM: phone, address, or DOB alone
-        medium_indicators = ["phone", "address", "dob", "date of birth", "birthday", "ip address"]
-        if any(term in " ".join(data_lower) for term in medium_indicators):
+        if found:
             return Severity.MEDIUM
 
         # LOW: just email/username
         return Severity.LOW
 
+    def _describe(self, exposed_data: list[str], password_risk: str | None) -> str:
+        """Format exposed data types (first 5) and password risk for a breach."""
+        parts = ["Exposed: ", ", ".join(exposed_data[:5])]
+        if len(exposed_data) > 5:
+            parts.append(f" (+{len(exposed_data) - 5} more)")
+        if password_risk:
+            parts.append(f" | Password Risk: {password_risk}")
+        return "".join(parts)
+
+    def _status_finding(self, status: str, parent_id: str | None, now: datetime) -> Finding:
+        """Build one of the fixed lookup-status findings."""
+        fields = dict(_STATUS_FINDINGS[status])
+        fields["data"] = dict(fields["data"])
+        return Finding.build(
+            **fields,
+            id=finding_id(),
+            type=_NT_BREACH,
+            severity=_SEV[Severity.LOW],
+            source="XposedOrNot",
+            timestamp=now,
+            parent_id=parent_id,
+        )
+
+    def _build_findings(
+        self, data: dict, email: str, parent_id: str | None, now: datetime
+    ) -> list[Finding]:
+        """Turn an XposedOrNot analytics response into findings."""
+        findings: list[Finding] = []
+
+        # Extract breach data
+        exposed_breaches = data.get("ExposedBreaches", {})
+        breaches_details = exposed_breaches.get("breaches_details", [])
+        metrics = data.get("BreachMetrics", {})
+        pastes = data.get("PastesSummary", {})
+
+        # Get summary metrics
+        risk_score = metrics.get("risk_score", 0) if metrics else 0
+        risk_label = metrics.get("risk_label", "Unknown") if metrics else "Unknown"
+        breach_count = len(breaches_details)
+
+        # Summary finding
+        if breach_count > 0:
+            summary_severity = (
+                Severity.CRITICAL if risk_score >= 7
+                else Severity.HIGH if risk_score >= 4
+                else Severity.MEDIUM
+            )
+            findings.append(Finding.build(
+                id=finding_id(),
+                type=_NT_BREACH,
+                severity=_SEV[summary_severity],
+                title=f"Found in {breach_count} Data Breach(es)",
+                description=f"Risk Level: {risk_label} ({risk_score}/10)",
+                source="XposedOrNot",
+                source_url=f"https://xposedornot.com/xposed/{email}",
+                timestamp=now,
+                data={
+                    "breach_count": breach_count,
+                    "risk_score": risk_score,
+                    "risk_label": risk_label,
+                },
+                parent_id=parent_id,
+                link_label="breached in",
+            ))
+
+        # Individual breach findings
+        for breach in breaches_details:
+            exposed_data = breach.get("xposed_data", [])
+            password_risk = breach.get("passwordrisk", None)
+            breach_name = breach.get("breach", "Unknown")
+
+            findings.append(Finding.build(
+                id=finding_id(),
+                type=_NT_BREACH,
+                severity=_SEV[self._determine_severity(exposed_data, password_risk)],
+                title=f"Breach: {breach_name}",
+                description=self._describe(exposed_data, password_risk),
+                source="XposedOrNot",
+                source_url="https://xposedornot.com",
+                timestamp=now,
+                data={
+                    "breach_name": breach_name,
+                    "breach_date": breach.get("xposed_date", "Unknown"),
+                    "exposed_data": exposed_data,
+                    "records": breach.get("xposed_records", 0),
+                    "industry": breach.get("industry", "Unknown"),
+                    "password_risk": password_risk,
+                },
+                parent_id=parent_id,
+                link_label="exposed in",
+            ))
+
+        # Paste dump exposure
+        paste_count = pastes.get("cnt", 0) if pastes else 0
+        if paste_count > 0:
+            findings.append(Finding.build(
+                id=finding_id(),
+                type=_NT_BREACH,
+                severity=_SEV[Severity.HIGH],
+                title=f"Found in {paste_count} Paste Dump(s)",
+                description="Email appeared in public paste sites",
+                source="XposedOrNot",
+                timestamp=now,
+                data={
+                    "paste_count": paste_count,
+                    "sources": pastes.get("domain", []) if pastes else [],
+                },
+                parent_id=parent_id,
+                link_label="dumped in",
+            ))
+
+        return findings
+
+    async def _lookup(self, email: str, parent_id: str | None) -> list[Finding]:
+        """Query XposedOrNot and return every finding for the email."""
+        # One snapshot time for every finding of this lookup
+        now = datetime.utcnow()
+
+        client = get_http_client()
+        try:
+            resp = await client.get(
+                self.API_URL,
+                params={"email": email},
+                timeout=self.timeout,
+            )
+
+            # Handle 404 - no breaches found
+            if resp.status_code == 404:
+                return [self._status_finding("clean", parent_id, now)]
+
+            # Handle rate limiting
+            if resp.status_code == 429:
+                return [self._status_finding("rate_limited", parent_id, now)]
+
+            if resp.status_code != 200:
+                return []
+
+            data = orjson.loads(resp.content)
+
+            return self._build_findings(data, email, parent_id, now)
+
+        except httpx.TimeoutException:
+            return [self._status_finding("timeout", parent_id, now)]
+
+        except Exception as e:
+            print(f"[BreachLookup] Error: {e}")
+            return []
+
     async def run(
         self,
         seed: str,
@@ -62,160 +244,8 @@ class BreachLookup(OSINTModule):
         """Check email for data breaches via XposedOrNot."""
 
         email = seed.lower().strip()
-        if '@' not in email:
+        if not EMAIL_RE.match(email):
             return
 
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(
-                    self.API_URL,
-                    params={"email": email},
-                    headers={"User-Agent": "TRACE-OSINT/1.0"},
-                    timeout=self.timeout,
-                )
-
-                # Handle 404 - no breaches found
-                if resp.status_code == 404:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.BREACH,
-                        severity=Severity.LOW,
-                        title="No Breaches Found",
-                        description="Email not found in any known data breaches",
-                        source="XposedOrNot",
-                        source_url="https://xposedornot.com",
-                        timestamp=datetime.utcnow(),
-                        data={"status": "clean", "breaches_found": 0},
-                        parent_id=parent_id,
-                        link_label="checked against",
-                    )
-                    return
-
-                # Handle rate limiting
-                if resp.status_code == 429:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.BREACH,
-                        severity=Severity.LOW,
-                        title="Breach Check Rate Limited",
-                        description="Too many requests, try again later",
-                        source="XposedOrNot",
-                        timestamp=datetime.utcnow(),
-                        data={"status": "rate_limited"},
-                        parent_id=parent_id,
-                        link_label="rate limited",
-                    )
-                    return
-
-                if resp.status_code != 200:
-                    return
-
-                data = resp.json()
-
-                # Extract breach data
-                exposed_breaches = data.get("ExposedBreaches", {})
-                breaches_details = exposed_breaches.get("breaches_details", [])
-                metrics = data.get("BreachMetrics", {})
-                pastes = data.get("PastesSummary", {})
-
-                # Get summary metrics
-                risk_score = metrics.get("risk_score", 0) if metrics else 0
-                risk_label = metrics.get("risk_label", "Unknown") if metrics else "Unknown"
-                breach_count = len(breaches_details)
-
-                # Summary finding
-                if breach_count > 0:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.BREACH,
-                        severity=Severity.CRITICAL if risk_score >= 7 else Severity.HIGH if risk_score >= 4 else Severity.MEDIUM,
-                        title=f"Found in {breach_count} Data Breach(es)",
-                        description=f"Risk Level: {risk_label} ({risk_score}/10)",
-                        source="XposedOrNot",
-                        source_url=f"https://xposedornot.com/xposed/{email}",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "breach_count": breach_count,
-                            "risk_score": risk_score,
-                            "risk_label": risk_label,
-                        },
-                        parent_id=parent_id,
-                        link_label="breached in",
-                    )
-
-                # Individual breach findings
-                for breach in breaches_details:
-                    breach_name = breach.get("breach", "Unknown")
-                    breach_date = breach.get("xposed_date", "Unknown")
-                    exposed_data = breach.get("xposed_data", [])
-                    records = breach.get("xposed_records", 0)
-                    industry = breach.get("industry", "Unknown")
-                    password_risk = breach.get("passwordrisk", None)
-
-                    severity = self._determine_severity(exposed_data, password_risk)
-
-                    # Format exposed data for description
-                    exposed_str = ", ".join(exposed_data[:5])
-                    if len(exposed_data) > 5:
-                        exposed_str += f" (+{len(exposed_data) - 5} more)"
-
-                    description = f"Exposed: {exposed_str}"
-                    if password_risk:
-                        description += f" | Password Risk: {password_risk}"
-
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.BREACH,
-                        severity=severity,
-                        title=f"Breach: {breach_name}",
-                        description=description,
-                        source="XposedOrNot",
-                        source_url=f"https://xposedornot.com",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "breach_name": breach_name,
-                            "breach_date": breach_date,
-                            "exposed_data": exposed_data,
-                            "records": records,
-                            "industry": industry,
-                            "password_risk": password_risk,
-                        },
-                        parent_id=parent_id,
-                        link_label="exposed in",
-                    )
-
-                # Paste dump exposure
-                paste_count = pastes.get("cnt", 0) if pastes else 0
-                if paste_count > 0:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.BREACH,
-                        severity=Severity.HIGH,
-                        title=f"Found in {paste_count} Paste Dump(s)",
-                        description="Email appeared in public paste sites",
-                        source="XposedOrNot",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "paste_count": paste_count,
-                            "sources": pastes.get("domain", []) if pastes else [],
-                        },
-                        parent_id=parent_id,
-                        link_label="dumped in",
-                    )
-
-            except httpx.TimeoutException:
-                yield Finding(
-                    id=str(uuid.uuid4()),
-                    type=NodeType.BREACH,
-                    severity=Severity.LOW,
-                    title="Breach Check Timeout",
-                    description="Request timed out, try again later",
-                    source="XposedOrNot",
-                    timestamp=datetime.utcnow(),
-                    data={"status": "timeout"},
-                    parent_id=parent_id,
-                    link_label="timeout",
-                )
-
-            except Exception as e:
-                print(f"[BreachLookup] Error: {e}")
+        for finding in await self._lookup(email, parent_id):
+            yield finding
@@ -2,15 +2,96 @@
 Connected account finder - discovers cross-platform links and same-identity accounts.
 """
 
+import asyncio
 import httpx
-import uuid
 import re
 import hashlib
 from typing import AsyncGenerator
 from datetime import datetime
 
 from .base import OSINTModule
-from models.findings import Finding, NodeType, Severity
+from models.findings import Finding, NodeType, Severity, finding_id
+from services.http import get_http_client
+from services.upstream import TTLCache
+
+# Every bio handle pattern fused into one alternation, matched against
+# lowercased text in a single pass. Each alternative has one named group;
+# the name prefix selects the platform in _HANDLE_PLATFORMS. Prefixes are
+# anchored on word boundaries and usernames bounded by each platform's
+# maximum length, so a long run of word characters is rejected instead of
+# scanned repeatedly. "\B@" skips the "@" inside email addresses.
+_HANDLE_RE = re.compile("|".join((
+    r'\btwitter\.com/(?P<twitter_url>\w{1,15})\b',
+    r'\bx\.com/(?P<twitter_x>\w{1,15})\b',
+    r'\btwitter:\s*@?(?P<twitter_label>\w{1,15})\b',
+    r'\binstagram\.com/(?P<instagram_url>\w{1,30})\b',
+    r'\binstagram:\s*@?(?P<instagram_label>\w{1,30})\b',
+    r'\big:\s*@?(?P<instagram_ig>\w{1,30})\b',
+    r'\blinkedin\.com/in/(?P<linkedin_url>[a-z0-9-]{1,100})',
+    r'\blinkedin:\s*(?P<linkedin_label>[a-z0-9-]{1,100})',
+    r'\bgithub\.com/(?P<github_url>\w{1,39})\b',
+    r'\bgithub:\s*@?(?P<github_label>\w{1,39})\b',
+    r'\byoutube\.com/(?:c/|channel/|user/|@)(?P<youtube_url>\w{1,100})\b',
+    r'\B@(?P<twitter_at>\w{1,15})\b',
+)))
+
+# Group prefix -> (platform, minimum username length)
+_HANDLE_PLATFORMS = {
+    "twitter": ("Twitter", 3),
+    "instagram": ("Instagram", 3),
+    "linkedin": ("LinkedIn", 0),
+    "github": ("GitHub", 2),
+    "youtube": ("YouTube", 0),
+}
+_TWITTER_STOPWORDS = frozenset({'twitter', 'com', 'the', 'and'})
+
+# Every handle pattern contains one of these literals; bios with none of
+# them skip the regex scan (plain substring search is far cheaper)
+_HANDLE_ANCHORS = ("@", "twitter", "x.com", "instagram", "ig:", "linkedin", "github", "youtube")
+
+# Generic URL extraction runs on the original-case text
+_URL_RE = re.compile(r'https?://([a-zA-Z0-9.-]+)/([a-zA-Z0-9_-]+)')
+
+# Other social domains picked up from generic URLs -> platform name
+_SOCIAL_DOMAINS = {
+    "facebook": "Facebook",
+    "tiktok": "TikTok",
+    "twitch": "Twitch",
+    "reddit": "Reddit",
+}
+_SOCIAL_DOMAIN_RE = re.compile("|".join(_SOCIAL_DOMAINS), re.IGNORECASE)
+
+# Username lookup API per platform
+_PROBE_APIS = {
+    "GitHub": "https://api.github.com/users/{username}",
+    "Reddit": "https://www.reddit.com/user/{username}/about.json",
+    "GitLab": "https://gitlab.com/api/v4/users?username={username}",
+    "Keybase": "https://keybase.io/_/api/1.0/user/lookup.json?username={username}",
+}
+
+# Caps in-flight probes across every concurrent scan, so many seeds can
+# fan out at once without flooding the shared connection pool
+_PROBE_SEMAPHORE = asyncio.Semaphore(32)
+
+# Probe results by (platform, username): the match or None. Shared across
+# scans so a username seen again skips the live API.
+_PROBE_CACHE = TTLCache(ttl=600.0, maxsize=4096)
+
+
+# Profile URL prefix per platform; the username is appended
+_PROFILE_URLS = {
+    "Twitter": "https://twitter.com/",
+    "Instagram": "https://instagram.com/",
+    "LinkedIn": "https://linkedin.com/in/",
+    "GitHub": "https://github.com/",
+    "Reddit": "https://reddit.com/u/",
+    "GitLab": "https://gitlab.com/",
+    "Keybase": "https://keybase.io/",
+    "YouTube": "https://youtube.com/@",
+    "TikTok": "https://tiktok.com/@",
+    "Facebook": "https://facebook.com/",
+    "Twitch": "https://twitch.tv/",
+}
 
 
 class ConnectedAccountFinder(OSINTModule):
@@ -24,75 +105,31 @@ class ConnectedAccountFinder(OSINTModule):
         """Extract social media links/handles from text."""
         links = []
 
-        # Twitter/X patterns
-        twitter_patterns = [
-            r'twitter\.com/(\w+)',
-            r'x\.com/(\w+)',
-            r'@(\w+)(?:\s+on\s+twitter|\s+on\s+x)?',
-            r'twitter:\s*@?(\w+)',
-        ]
-        for pattern in twitter_patterns:
-            matches = re.findall(pattern, text.lower())
-            for match in matches:
-                if len(match) >= 3 and match not in ['twitter', 'com', 'the', 'and']:
-                    links.append({"platform": "Twitter", "username": match})
-
-        # Instagram patterns
-        ig_patterns = [
-            r'instagram\.com/(\w+)',
-            r'instagram:\s*@?(\w+)',
-            r'ig:\s*@?(\w+)',
-        ]
-        for pattern in ig_patterns:
-            matches = re.findall(pattern, text.lower())
-            for match in matches:
-                if len(match) >= 3:
-                    links.append({"platform": "Instagram", "username": match})
-
-        # LinkedIn patterns
-        li_patterns = [
-            r'linkedin\.com/in/([a-z0-9-]+)',
-            r'linkedin:\s*([a-z0-9-]+)',
-        ]
-        for pattern in li_patterns:
-            matches = re.findall(pattern, text.lower())
-            for match in matches:
-                links.append({"platform": "LinkedIn", "username": match})
-
-        # GitHub patterns
-        gh_patterns = [
-            r'github\.com/(\w+)',
-            r'github:\s*@?(\w+)',
-        ]
-        for pattern in gh_patterns:
-            matches = re.findall(pattern, text.lower())
-            for match in matches:
-                if len(match) >= 2:
-                    links.append({"platform": "GitHub", "username": match})
-
-        # YouTube patterns
-        yt_patterns = [
-            r'youtube\.com/(?:c/|channel/|user/|@)(\w+)',
-        ]
-        for pattern in yt_patterns:
-            matches = re.findall(pattern, text.lower())
-            for match in matches:
-                links.append({"platform": "YouTube", "username": match})
+        text_lower = text.lower()
+        if any(anchor in text_lower for anchor in _HANDLE_ANCHORS):
+            for match in _HANDLE_RE.finditer(text_lower):
+                group = match.lastgroup
+                platform, min_length = _HANDLE_PLATFORMS[group.partition("_")[0]]
+                username = match.group(group)
+                if len(username) < min_length:
+                    continue
+                if platform == "Twitter" and username in _TWITTER_STOPWORDS:
+                    continue
+                links.append({"platform": platform, "username": username})
 
         # Generic URL extraction
-        url_pattern = r'https?://([a-zA-Z0-9.-]+)/([a-zA-Z0-9_-]+)'
-        url_matches = re.findall(url_pattern, text)
-        for domain, path in url_matches:
-            if any(social in domain for social in ['facebook', 'tiktok', 'twitch', 'reddit']):
-                platform = domain.split('.')[0].title()
-                if len(path) >= 2:
+        if "http" in text:
+            for domain, path in _URL_RE.findall(text):
+                social = _SOCIAL_DOMAIN_RE.search(domain)
+                if social and len(path) >= 2:
+                    platform = _SOCIAL_DOMAINS[social.group().lower()]
                     links.append({"platform": platform, "username": path})
 
         return links
 
     def _hash_avatar(self, avatar_data: bytes) -> str:
         """Generate hash of avatar image for comparison."""
-        return hashlib.md5(avatar_data).hexdigest()
+        return hashlib.blake2b(avatar_data, digest_size=16).hexdigest()
 
     async def _check_username_availability(
         self,
@@ -101,50 +138,63 @@ class ConnectedAccountFinder(OSINTModule):
         platforms: list[str]
     ) -> list[dict]:
         """Check if username exists on platforms (quick API checks)."""
-        found = []
-
-        platform_apis = {
-            "GitHub": f"https://api.github.com/users/{username}",
-            "Reddit": f"https://www.reddit.com/user/{username}/about.json",
-            "GitLab": f"https://gitlab.com/api/v4/users?username={username}",
-            "Keybase": f"https://keybase.io/_/api/1.0/user/lookup.json?username={username}",
-        }
+        # Probes are independent, so run them concurrently
+        tasks = [
+            self._probe(client, platform, _PROBE_APIS[platform].format(username=username), username)
+            for platform in platforms
+            if platform in _PROBE_APIS
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        for platform in platforms:
-            if platform not in platform_apis:
-                continue
+        return [result for result in results if isinstance(result, dict)]
 
-            try:
-                resp = await client.get(
-                    platform_apis[platform],
-                    headers={"User-Agent": "TRACE-OSINT"},
-                    timeout=5.0,
-                )
-
-                exists = False
-                if platform == "GitHub" and resp.status_code == 200:
-                    exists = True
-                elif platform == "Reddit" and resp.status_code == 200:
-                    data = resp.json()
-                    exists = "data" in data and data["data"].get("name")
-                elif platform == "GitLab" and resp.status_code == 200:
-                    data = resp.json()
-                    exists = len(data) > 0
-                elif platform == "Keybase" and resp.status_code == 200:
-                    data = resp.json()
-                    exists = data.get("status", {}).get("code") == 0
-
-                if exists:
-                    found.append({
-                        "platform": platform,
-                        "username": username,
-                        "url": platform_apis[platform].replace("/api/", "/").replace(".json", ""),
-                    })
-
-            except Exception:
-                pass
-
-        return found
+    async def _probe(
+        self,
+        client: httpx.AsyncClient,
+        platform: str,
+        url: str,
+        username: str
+    ) -> dict | None:
+        """Probe one platform API; return the match or None."""
+        key = (platform, username.lower())
+        hit, cached = _PROBE_CACHE.get(key)
+        if hit:
+            return cached
+
+        async with _PROBE_SEMAPHORE:
+            resp = await client.get(
+                url,
+                headers={"User-Agent": "TRACE-OSINT"},
+                timeout=5.0,
+                follow_redirects=True,
+            )
+
+        exists = False
+        if platform == "GitHub" and resp.status_code == 200:
+            exists = True
+        elif platform == "Reddit" and resp.status_code == 200:
+            data = resp.json()
+            exists = "data" in data and data["data"].get("name")
+        elif platform == "GitLab" and resp.status_code == 200:
+            data = resp.json()
+            exists = len(data) > 0
+        elif platform == "Keybase" and resp.status_code == 200:
+            data = resp.json()
+            exists = data.get("status", {}).get("code") == 0
+
+        result = None
+        if exists:
+            result = {
+                "platform": platform,
+                "username": username,
+                "url": url.replace("/api/", "/").replace(".json", ""),
+            }
+
+        # Only definitive answers are cached; errors and rate limits retry
+        if resp.status_code in (200, 404):
+            _PROBE_CACHE.put(key, result)
+
+        return result
 
     async def run(
         self,
@@ -169,115 +219,118 @@ class ConnectedAccountFinder(OSINTModule):
         bios = data.get("bios", [])
         found_accounts = data.get("found_accounts", [])  # Already found platforms
 
-        async with httpx.AsyncClient(follow_redirects=True) as client:
-
-            # Extract links from bios
-            all_links = []
-            for bio in bios:
-                if bio:
-                    extracted = self._extract_social_links(bio)
-                    all_links.extend(extracted)
-
-            # Dedupe
-            seen = set()
-            unique_links = []
-            for link in all_links:
-                key = f"{link['platform']}:{link['username']}"
-                if key not in seen:
-                    seen.add(key)
-                    unique_links.append(link)
-
-            # Report linked accounts from bios
-            for link in unique_links:
-                # Skip if we already found this account
-                if any(
-                    a.get("platform", "").lower() == link["platform"].lower() and
-                    a.get("username", "").lower() == link["username"].lower()
-                    for a in found_accounts
-                ):
-                    continue
+        # One snapshot time for every finding of this run
+        now = datetime.utcnow()
+
+        # Shared pooled client (HTTP/2, keep-alive) reused across seeds
+        client = get_http_client()
+
+        # Extract links from bios
+        all_links = []
+        for bio in bios:
+            if bio:
+                extracted = self._extract_social_links(bio)
+                all_links.extend(extracted)
+
+        # Dedupe
+        seen = set()
+        unique_links = []
+        link_keys = []  # "Platform:username", in discovery order
+        for link in all_links:
+            key = f"{link['platform']}:{link['username']}"
+            if key not in seen:
+                seen.add(key)
+                unique_links.append(link)
+                link_keys.append(key)
+
+        # Accounts already found by earlier modules
+        found_keys = {
+            (a.get("platform", "").lower(), a.get("username", "").lower())
+            for a in found_accounts
+        }
+
+        # Report linked accounts from bios
+        for link in unique_links:
+            # Skip if we already found this account
+            if (link["platform"].lower(), link["username"].lower()) in found_keys:
+                continue
 
-                yield Finding(
-                    id=str(uuid.uuid4()),
-                    type=NodeType.ACCOUNT,
-                    severity=Severity.MEDIUM,
-                    title=f"Linked: {link['platform']} @{link['username']}",
-                    description=f"Account mentioned in profile bio",
-                    source="Bio Analysis",
-                    source_url=self._get_profile_url(link["platform"], link["username"]),
-                    timestamp=datetime.utcnow(),
-                    data={
-                        "platform": link["platform"],
-                        "username": link["username"],
-                        "discovery_method": "bio_mention",
-                    },
-                    parent_id=parent_id,
-                    link_label="links to",
-                )
-
-            # Check same username on other platforms
-            platforms_to_check = ["GitHub", "Reddit", "GitLab", "Keybase"]
-            found_platforms = [a.get("platform", "").lower() for a in found_accounts]
-
-            for username in usernames[:3]:  # Limit to avoid rate limits
-                # Remove platforms we already found
-                remaining = [p for p in platforms_to_check if p.lower() not in found_platforms]
-
-                if remaining:
-                    matches = await self._check_username_availability(client, username, remaining)
-
-                    for match in matches:
-                        yield Finding(
-                            id=str(uuid.uuid4()),
-                            type=NodeType.ACCOUNT,
-                            severity=Severity.MEDIUM,
-                            title=f"Same Username: {match['platform']}",
-                            description=f"Username '{username}' also exists on {match['platform']}",
-                            source="Username Correlation",
-                            source_url=self._get_profile_url(match["platform"], username),
-                            timestamp=datetime.utcnow(),
-                            data={
-                                "platform": match["platform"],
-                                "username": username,
-                                "discovery_method": "username_match",
-                                "confidence": "high",
-                            },
-                            parent_id=parent_id,
-                            link_label="same user on",
-                        )
-
-            # Summary if we found connections
-            total_connections = len(unique_links) + sum(1 for _ in [])  # Placeholder for additional
-            if total_connections > 0:
-                yield Finding(
-                    id=str(uuid.uuid4()),
-                    type=NodeType.PERSONAL_INFO,
-                    severity=Severity.LOW,
-                    title=f"Account Network: {total_connections} connections",
-                    description="Cross-platform account relationships identified",
-                    source="Connection Analysis",
-                    timestamp=datetime.utcnow(),
-                    data={
-                        "total_connections": total_connections,
-                        "linked_accounts": unique_links,
-                    },
-                    parent_id=parent_id,
-                    link_label="connected to",
-                )
+            yield Finding.build(
+                id=finding_id(),
+                type=NodeType.ACCOUNT,
+                severity=Severity.MEDIUM,
+                title=f"Linked: {link['platform']} @{link['username']}",
+                description=f"Account mentioned in profile bio",
+                source="Bio Analysis",
+                source_url=self._get_profile_url(link["platform"], link["username"]),
+                timestamp=now,
+                data={
+                    "platform": link["platform"],
+                    "username": link["username"],
+                    "discovery_method": "bio_mention",
+                },
+                parent_id=parent_id,
+                link_label="links to",
+            )
+
+        # Check same username on other platforms
+        platforms_to_check = ["GitHub", "Reddit", "GitLab", "Keybase"]
+        found_platforms = frozenset(platform for platform, _ in found_keys)
+
+        # Remove platforms we already found
+        remaining = [p for p in platforms_to_check if p.lower() not in found_platforms]
+
+        checked = usernames[:3]  # Limit to avoid rate limits
+        if remaining and checked:
+            all_matches = await asyncio.gather(*(
+                self._check_username_availability(client, username, remaining)
+                for username in checked
+            ))
+
+            for username, matches in zip(checked, all_matches):
+                for match in matches:
+                    yield Finding.build(
+                        id=finding_id(),
+                        type=NodeType.ACCOUNT,
+                        severity=Severity.MEDIUM,
+                        title=f"Same Username: {match['platform']}",
+                        description=f"Username '{username}' also exists on {match['platform']}",
+                        source="Username Correlation",
+                        source_url=self._get_profile_url(match["platform"], username),
+                        timestamp=now,
+                        data={
+                            "platform": match["platform"],
+                            "username": username,
+                            "discovery_method": "username_match",
+                            "confidence": "high",
+                        },
+                        parent_id=parent_id,
+                        link_label="same user on",
+                    )
+
+        # Summary if we found connections
+        total_connections = len(unique_links) + sum(1 for _ in [])  # Placeholder for additional
+        if total_connections > 0:
+            yield Finding.build(
+                id=finding_id(),
+                type=NodeType.PERSONAL_INFO,
+                severity=Severity.LOW,
+                title=f"Account Network: {total_connections} connections",
+                description="Cross-platform account relationships identified",
+                source="Connection Analysis",
+                timestamp=now,
+                data={
+                    "total_connections": total_connections,
+                    # Each link is already its own finding; reference them compactly
+                    "linked_accounts": link_keys,
+                },
+                parent_id=parent_id,
+                link_label="connected to",
+            )
 
     def _get_profile_url(self, platform: str, username: str) -> str:
         """Get profile URL for a platform."""
-        urls = {
-            "Twitter": f"https://twitter.com/{username}",
-            "Instagram": f"https://instagram.com/{username}",
-            "LinkedIn": f"https://linkedin.com/in/{username}",
-            "GitHub": f"https://github.com/{username}",
-            "Reddit": f"https://reddit.com/u/{username}",
-            "GitLab": f"https://gitlab.com/{username}",
-            "Keybase": f"https://keybase.io/{username}",
-            "YouTube": f"https://youtube.com/@{username}",
-            "TikTok": f"https://tiktok.com/@{username}",
-            "Facebook": f"https://facebook.com/{username}",
-            "Twitch": f"https://twitch.tv/{username}",
-        }
-        return urls.get(platform, f"https://{platform.lower()}.com/{username}")
+        prefix = _PROFILE_URLS.get(platform)
+        if prefix is None:
+            return f"https://{platform.lower()}.com/{username}"
+        return prefix + username
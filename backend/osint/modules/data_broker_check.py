@@ -3,13 +3,12 @@ Data broker warning module.
 Generates search URLs for major people-search sites and provides opt-out information.
 """
 
-import uuid
 import urllib.parse
 from typing import AsyncGenerator
 from datetime import datetime
 
-from .base import OSINTModule
-from models.findings import Finding, NodeType, Severity
+from .base import OSINTModule, EMAIL_RE
+from models.findings import Finding, NodeType, Severity, finding_id
 
 
 # Major data brokers with search URL templates and opt-out links
@@ -101,6 +100,30 @@ DATA_BROKERS = [
 ]
 
 
+def _broker_template(broker: dict) -> tuple[str, str, dict]:
+    """Split a broker's search URL around {email}; the rest of its entry is fixed."""
+    pre, _, post = broker["search_url"].partition("{email}")
+    info = {
+        "name": broker["name"],
+        "search_url": None,  # filled in per email
+        "opt_out_url": broker["opt_out"],
+        "data_types": broker["data_types"],
+    }
+    return pre, post, info
+
+
+# Broker entries partitioned by risk once at import, with search URLs
+# pre-split so run() only concatenates the encoded email
+_HIGH_BROKERS = [_broker_template(b) for b in DATA_BROKERS if b["severity"] == "high"]
+_MEDIUM_BROKERS = [_broker_template(b) for b in DATA_BROKERS if b["severity"] != "high"]
+
+# Separators in an email local part that split it into name parts
+_NAME_TBL = str.maketrans("._-", "   ")
+
+# (name, opt-out URL) per broker; each finding gets fresh dicts built from these
+_ALL_OPT_OUTS = tuple((b["name"], b["opt_out"]) for b in DATA_BROKERS)
+
+
 class DataBrokerCheck(OSINTModule):
     name = "Data Broker Warning"
     description = "Check for exposure on people-search sites"
@@ -119,25 +142,28 @@ class DataBrokerCheck(OSINTModule):
         """
 
         email = seed.lower().strip()
-        if '@' not in email:
+        if not EMAIL_RE.match(email):
             return
 
+        # One snapshot time for every finding of this run
+        now = datetime.utcnow()
+
         # URL encode the email
         encoded_email = urllib.parse.quote(email)
 
         # Get name from email if possible (for name-based searches)
         local = email.split('@')[0]
-        name_parts = local.replace('.', ' ').replace('_', ' ').replace('-', ' ').split()
+        name_parts = local.translate(_NAME_TBL).split()
 
         # Main warning finding
-        yield Finding(
-            id=str(uuid.uuid4()),
+        yield Finding.build(
+            id=finding_id(),
             type=NodeType.BREACH,
             severity=Severity.HIGH,
             title="Data Broker Exposure Warning",
             description=f"Your information is likely listed on {len(DATA_BROKERS)} people-search sites",
             source="Data Broker Analysis",
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             data={
                 "broker_count": len(DATA_BROKERS),
                 "warning": "These sites aggregate public records and may expose your personal information",
@@ -148,34 +174,25 @@ class DataBrokerCheck(OSINTModule):
         )
 
         # Generate findings for each broker
-        high_risk = []
-        medium_risk = []
-
-        for broker in DATA_BROKERS:
-            search_url = broker["search_url"].format(email=encoded_email)
-
-            broker_info = {
-                "name": broker["name"],
-                "search_url": search_url,
-                "opt_out_url": broker["opt_out"],
-                "data_types": broker["data_types"],
-            }
-
-            if broker["severity"] == "high":
-                high_risk.append(broker_info)
-            else:
-                medium_risk.append(broker_info)
+        high_risk = [
+            {**info, "search_url": pre + encoded_email + post, "data_types": list(info["data_types"])}
+            for pre, post, info in _HIGH_BROKERS
+        ]
+        medium_risk = [
+            {**info, "search_url": pre + encoded_email + post, "data_types": list(info["data_types"])}
+            for pre, post, info in _MEDIUM_BROKERS
+        ]
 
         # High-risk brokers finding
         if high_risk:
-            yield Finding(
-                id=str(uuid.uuid4()),
+            yield Finding.build(
+                id=finding_id(),
                 type=NodeType.BREACH,
                 severity=Severity.HIGH,
                 title=f"High-Risk Brokers: {len(high_risk)} sites",
                 description="Sites with extensive personal data collection",
                 source="Data Broker Analysis",
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 data={
                     "brokers": high_risk,
                     "risk_level": "high",
@@ -187,14 +204,14 @@ class DataBrokerCheck(OSINTModule):
 
         # Medium-risk brokers finding
         if medium_risk:
-            yield Finding(
-                id=str(uuid.uuid4()),
+            yield Finding.build(
+                id=finding_id(),
                 type=NodeType.BREACH,
                 severity=Severity.MEDIUM,
                 title=f"Other Brokers: {len(medium_risk)} sites",
                 description="Additional people-search sites",
                 source="Data Broker Analysis",
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 data={
                     "brokers": medium_risk,
                     "risk_level": "medium",
@@ -204,19 +221,16 @@ class DataBrokerCheck(OSINTModule):
             )
 
         # Opt-out summary
-        all_opt_outs = [
-            {"name": b["name"], "url": b["opt_out"]}
-            for b in DATA_BROKERS
-        ]
+        all_opt_outs = [{"name": name, "url": url} for name, url in _ALL_OPT_OUTS]
 
-        yield Finding(
-            id=str(uuid.uuid4()),
+        yield Finding.build(
+            id=finding_id(),
             type=NodeType.PERSONAL_INFO,
             severity=Severity.LOW,
             title="Opt-Out Links Available",
             description=f"Direct removal links for {len(all_opt_outs)} data brokers",
             source="Data Broker Analysis",
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             data={
                 "opt_out_links": all_opt_outs,
                 "instructions": "Visit each link to request removal of your data",
@@ -4,14 +4,168 @@ Replicates techniques used by epieos.com
 """
 
 import httpx
-import uuid
+import orjson
+import asyncio
 import hashlib
 import re
-from typing import AsyncGenerator
+import random
+import logging
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+from typing import AsyncGenerator, AsyncIterator
 from datetime import datetime
 
-from .base import OSINTModule
-from models.findings import Finding, NodeType, Severity
+from .base import OSINTModule, EMAIL_RE
+from models.findings import Finding, NodeType, Severity, finding_id
+from services.http import get_http_client
+from services.upstream import (
+    CHECK_DEADLINE, HostThrottle, SingleFlight, TTLCache, UPSTREAM_FAILED, within_deadline,
+)
+
+logger = logging.getLogger("trace.epieos")
+
+# Lookup URL prefixes; the email (or its hash) is appended
+_GOOGLE_PHOTO_URL = "https://www.google.com/s2/photos/public/"
+_GOOGLE_MAPS_URL = "https://www.google.com/maps/contrib/0?q="
+_GRAVATAR_URL = "https://www.gravatar.com/"
+_GRAVATAR_PROFILE_URL = "https://gravatar.com/"
+
+# Request headers, built once and shared read-only by every request
+_UA_HEADERS = MappingProxyType({"User-Agent": "Mozilla/5.0"})
+_TRACE_HEADERS = MappingProxyType({"User-Agent": "TRACE-OSINT"})
+_JSON_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0",
+    "Content-Type": "application/json",
+})
+_INSTAGRAM_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0",
+    "X-CSRFToken": "missing",
+})
+_ADOBE_HEADERS = MappingProxyType({
+    "User-Agent": "Mozilla/5.0",
+    "Content-Type": "application/json",
+    "X-IMS-CLIENTID": "adobedotcom2",
+})
+
+# Requests in flight per target host, shared by every concurrent scan, and
+# the backoff each host asked for in its Retry-After / X-RateLimit-* headers
+_HOSTS = HostThrottle(per_host=4, max_wait=5.0)
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+# Lookup results by (source, sha256 of the email), or None. Shared across
+# scans so an email seen again skips the live request; hashing keeps raw
+# addresses out of process memory.
+_RESULT_CACHE = TTLCache(ttl=3600.0, maxsize=4096)
+
+# Lookups currently running, by the same key as _RESULT_CACHE
+_INFLIGHT = SingleFlight()
+
+
+def _cache_key(source: str, email: str) -> tuple[str, bytes]:
+    """_RESULT_CACHE / _INFLIGHT key for a lookup."""
+    return source, hashlib.sha256(email.encode()).digest()
+
+
+def _cached(source: str):
+    """
+    Serve a service check from _RESULT_CACHE, coalescing concurrent calls.
+
+    Only definitive answers are cached: a None caused by an upstream
+    failure would otherwise read as "not registered" for the whole TTL.
+    """
+    def decorator(check):
+        @wraps(check)
+        async def wrapper(self, client: httpx.AsyncClient, email: str) -> dict | None:
+            key = _cache_key(source, email)
+            hit, cached = _RESULT_CACHE.get(key)
+            if hit:
+                return cached
+
+            async def fetch():
+                token = UPSTREAM_FAILED.set(False)
+                try:
+                    result = await check(self, client, email)
+                    if not UPSTREAM_FAILED.get():
+                        _RESULT_CACHE.put(key, result)
+                    return result
+                finally:
+                    UPSTREAM_FAILED.reset(token)
+
+            return await _INFLIGHT.run(key, fetch)
+        return wrapper
+    return decorator
+
+
+# Either marker on a Maps contributions page means the account has activity;
+# matched on the raw bytes so the page is never decoded
+_MAPS_RE = re.compile(rb"Local Guide|contributions")
+
+# Finding builders with this module's fixed fields filled in; only the
+# per-scan fields are passed at each call
+_GOOGLE_ACCOUNT = partial(
+    Finding.build,
+    type=NodeType.ACCOUNT,
+    severity=Severity.MEDIUM,
+    title="Google Account Detected",
+    description="Email is associated with a Google account",
+    source="Google OSINT",
+    link_label="has account",
+)
+_GRAVATAR_NAME = partial(
+    Finding.build,
+    type=NodeType.PERSONAL_INFO,
+    severity=Severity.HIGH,
+    description="Name found via Gravatar profile",
+    source="Gravatar",
+    link_label="named",
+)
+_GRAVATAR_LOCATION = partial(
+    Finding.build,
+    type=NodeType.PERSONAL_INFO,
+    severity=Severity.MEDIUM,
+    description="Location from Gravatar profile",
+    source="Gravatar",
+    link_label="located in",
+)
+_GRAVATAR_ACCOUNTS = partial(
+    Finding.build,
+    type=NodeType.ACCOUNT,
+    severity=Severity.MEDIUM,
+    source="Gravatar",
+    link_label="linked to",
+)
+_SERVICES_SUMMARY = partial(
+    Finding.build,
+    type=NodeType.ACCOUNT,
+    severity=Severity.MEDIUM,
+    source="Email Registration Check",
+    link_label="registered on",
+)
+_SERVICE_ACCOUNT = partial(
+    Finding.build,
+    type=NodeType.ACCOUNT,
+    severity=Severity.MEDIUM,
+    source="Email Registration Check",
+    link_label="account on",
+)
+
+# Registered services that also get their own account finding
+_ACCOUNT_FINDING_SERVICES = frozenset({"Twitter", "Instagram", "Discord", "GitHub"})
+
+# Case-insensitive page markers for the HTML checks, matched on raw bytes
+# so the body is neither decoded nor lowercased
+_AMAZON_PASSWORD_RE = re.compile(rb"password", re.IGNORECASE)
+_AMAZON_FORGOT_RE = re.compile(rb"forgot", re.IGNORECASE)
+_GITHUB_TAKEN_RE = re.compile(rb"already taken", re.IGNORECASE)
+
+# Google photo fingerprints cover only this many leading bytes
+_PHOTO_HASH_BYTES = 64 * 1024
+
+
+@lru_cache(maxsize=4096)
+def _email_md5(email: str) -> str:
+    """Gravatar hash of a normalized email."""
+    return hashlib.md5(email.encode(), usedforsecurity=False).hexdigest()
 
 
 class EpieosLookup(OSINTModule):
@@ -20,6 +174,48 @@ class EpieosLookup(OSINTModule):
 
     def __init__(self):
         self.timeout = 15.0
+        self.check_timeout = 10.0  # End-to-end budget for one lookup, retries included
+        self.max_retries = 2
+
+    async def _request(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        url: str,
+        *,
+        retry: bool | None = None,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Send a request under its host's limit, backing off when rate limited.
+
+        Only GETs are retried unless retry=True marks a POST as a read-only
+        lookup; signup, sign-in and password-reset POSTs are sent once, as
+        replaying them can trip anti-abuse defences. A retry whose wait
+        would run past the lookup's deadline is skipped.
+        """
+        if retry is None:
+            retry = method == "GET"
+        host = httpx.URL(url).host
+        for attempt in range(self.max_retries + 1):
+            async with _HOSTS.slot(host):
+                resp = await client.request(method, url, **kwargs)
+            _HOSTS.note(host, resp)
+
+            if resp.status_code not in _RETRY_STATUSES:
+                return resp
+
+            # A header-driven wait is taken under the semaphore on the next
+            # attempt; without one, back off exponentially with jitter
+            host_wait = _HOSTS.ready_in(host)
+            backoff = 0.0 if host_wait > 0 else 2 ** attempt + random.random()
+            out_of_budget = not within_deadline(max(backoff, host_wait))
+            if not retry or attempt == self.max_retries or out_of_budget:
+                UPSTREAM_FAILED.set(True)
+                return resp
+            if backoff:
+                await asyncio.sleep(backoff)
+        return resp
 
     async def _check_google_account(
         self,
@@ -30,41 +226,49 @@ class EpieosLookup(OSINTModule):
         try:
             # Google's people API for public profiles
             # This checks if there's a Google+ legacy or Google account
-            resp = await client.get(
-                f"https://www.google.com/s2/photos/public/{email}",
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=self.timeout,
-                follow_redirects=True,
-            )
-
             result = {}
 
-            # Check for profile photo (indicates Google account exists)
-            if resp.status_code == 200 and "image" in resp.headers.get("content-type", ""):
-                result["has_google_account"] = True
-                result["has_profile_photo"] = True
-
-                # Hash the photo for correlation
-                photo_hash = hashlib.md5(resp.content).hexdigest()
-                result["photo_hash"] = photo_hash
+            async with client.stream(
+                "GET",
+                _GOOGLE_PHOTO_URL + email,
+                headers=_UA_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+            ) as resp:
+                # Check for profile photo (indicates Google account exists)
+                if resp.status_code == 200 and "image" in resp.headers.get("content-type", ""):
+                    result["has_google_account"] = True
+                    result["has_profile_photo"] = True
+
+                    # Hash the start of the photo for correlation; the rest
+                    # of a large image is never downloaded
+                    photo = hashlib.blake2b(digest_size=16)
+                    remaining = _PHOTO_HASH_BYTES
+                    async for chunk in resp.aiter_bytes():
+                        photo.update(chunk[:remaining])
+                        remaining -= len(chunk)
+                        if remaining <= 0:
+                            break
+                    result["photo_hash"] = photo.hexdigest()
 
             # Try Google Maps contributions
-            maps_resp = await client.get(
-                f"https://www.google.com/maps/contrib/0?q={email}",
-                headers={"User-Agent": "Mozilla/5.0"},
+            maps_resp = await self._request(
+                client, "GET",
+                _GOOGLE_MAPS_URL + email,
+                headers=_UA_HEADERS,
                 timeout=self.timeout,
                 follow_redirects=True,
             )
 
             if maps_resp.status_code == 200:
-                if "Local Guide" in maps_resp.text or "contributions" in maps_resp.text:
+                if _MAPS_RE.search(maps_resp.content):
                     result["has_maps_activity"] = True
 
             if result:
                 return result
 
         except Exception as e:
-            print(f"[Epieos] Google check error: {e}")
+            logger.debug("Google check error: %s", e)
 
         return None
 
@@ -74,21 +278,37 @@ class EpieosLookup(OSINTModule):
         email: str
     ) -> dict | None:
         """Check Gravatar for profile info."""
+        key = _cache_key("Gravatar", email)
+        hit, cached = _RESULT_CACHE.get(key)
+        if hit:
+            return cached
+        return await _INFLIGHT.run(key, lambda: self._fetch_gravatar(client, email))
+
+    async def _fetch_gravatar(
+        self,
+        client: httpx.AsyncClient,
+        email: str
+    ) -> dict | None:
+        """Fetch the Gravatar JSON profile, caching definitive answers."""
         try:
-            email_hash = hashlib.md5(email.lower().encode()).hexdigest()
+            email_hash = _email_md5(email.lower())
 
             # Check JSON profile
-            resp = await client.get(
-                f"https://www.gravatar.com/{email_hash}.json",
-                headers={"User-Agent": "TRACE-OSINT"},
+            resp = await self._request(
+                client, "GET",
+                _GRAVATAR_URL + email_hash + ".json",
+                headers=_TRACE_HEADERS,
                 timeout=self.timeout,
             )
 
+            if resp.status_code == 404:
+                _RESULT_CACHE.put(_cache_key("Gravatar", email), None)
+
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 entry = data.get("entry", [{}])[0]
 
-                return {
+                profile = {
                     "display_name": entry.get("displayName"),
                     "name": entry.get("name", {}),
                     "location": entry.get("currentLocation"),
@@ -101,20 +321,20 @@ class EpieosLookup(OSINTModule):
                     "photos": [p.get("value") for p in entry.get("photos", [])],
                     "hash": email_hash,
                 }
+                _RESULT_CACHE.put(_cache_key("Gravatar", email), profile)
+                return profile
 
         except Exception:
             pass
 
         return None
 
-    async def _check_holehe_services(
+    async def _iter_holehe(
         self,
         client: httpx.AsyncClient,
         email: str
-    ) -> list[dict]:
-        """Check various services for email registration (holehe-style)."""
-        registered = []
-
+    ) -> AsyncIterator[dict]:
+        """Yield each service the email is registered on (holehe-style) as its check finishes."""
         # Services to check with their recovery/signup endpoints
         services = [
             ("Twitter", self._check_twitter),
@@ -129,99 +349,109 @@ class EpieosLookup(OSINTModule):
             ("Pinterest", self._check_pinterest),
         ]
 
-        for name, check_func in services:
+        async def check(name: str, check_func):
             try:
-                result = await check_func(client, email)
+                async with asyncio.timeout(self.check_timeout) as budget:
+                    CHECK_DEADLINE.set(budget.when())
+                    return name, await check_func(client, email)
+            except Exception:
+                return name, None
+
+        # Every check is independent I/O; run them all at once on the pool
+        tasks = [asyncio.create_task(check(name, func)) for name, func in services]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                name, result = await next_done
                 if result and result.get("exists"):
-                    registered.append({
+                    yield {
                         "service": name,
                         **result
-                    })
-            except Exception:
-                pass
-
-            import asyncio
-            await asyncio.sleep(0.5)
-
-        return registered
+                    }
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    @_cached("Twitter")
     async def _check_twitter(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.get(
+            resp = await self._request(
+                client, "GET",
                 "https://api.twitter.com/i/users/email_available.json",
                 params={"email": email},
-                headers={"User-Agent": "Mozilla/5.0"},
+                headers=_UA_HEADERS,
                 timeout=10.0,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 if not data.get("valid"):
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("Instagram")
     async def _check_instagram(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://www.instagram.com/accounts/web_create_ajax/attempt/",
                 data={"email": email},
-                headers={
-                    "User-Agent": "Mozilla/5.0",
-                    "X-CSRFToken": "missing",
-                },
+                headers=_INSTAGRAM_HEADERS,
                 timeout=10.0,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 if data.get("errors", {}).get("email"):
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("Spotify")
     async def _check_spotify(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.get(
+            resp = await self._request(
+                client, "GET",
                 "https://spclient.wg.spotify.com/signup/public/v1/account",
                 params={"validate": 1, "email": email},
-                headers={"User-Agent": "Mozilla/5.0"},
+                headers=_UA_HEADERS,
                 timeout=10.0,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 if data.get("status") == 20:
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("Discord")
     async def _check_discord(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://discord.com/api/v9/auth/register",
                 json={"email": email, "username": "test", "password": "Test123456!"},
-                headers={"User-Agent": "Mozilla/5.0"},
+                headers=_UA_HEADERS,
                 timeout=10.0,
             )
             if resp.status_code == 400:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 if "email" in str(data.get("errors", {})):
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("Adobe")
     async def _check_adobe(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://auth.services.adobe.com/signin/v2/users/accounts",
                 json={"username": email},
-                headers={
-                    "User-Agent": "Mozilla/5.0",
-                    "Content-Type": "application/json",
-                    "X-IMS-CLIENTID": "adobedotcom2",
-                },
+                headers=_ADOBE_HEADERS,
+                retry=True,
                 timeout=10.0,
             )
             if resp.status_code == 200:
@@ -230,31 +460,32 @@ class EpieosLookup(OSINTModule):
             pass
         return None
 
+    @_cached("Amazon")
     async def _check_amazon(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://www.amazon.com/ap/signin",
                 data={"email": email},
-                headers={"User-Agent": "Mozilla/5.0"},
+                headers=_UA_HEADERS,
                 timeout=10.0,
                 follow_redirects=True,
             )
             if resp.status_code == 200:
-                if "password" in resp.text.lower() and "forgot" in resp.text.lower():
+                if _AMAZON_PASSWORD_RE.search(resp.content) and _AMAZON_FORGOT_RE.search(resp.content):
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("Apple")
     async def _check_apple(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://iforgot.apple.com/password/verify/appleid",
                 json={"id": email},
-                headers={
-                    "User-Agent": "Mozilla/5.0",
-                    "Content-Type": "application/json",
-                },
+                headers=_JSON_HEADERS,
                 timeout=10.0,
             )
             if resp.status_code == 200:
@@ -263,56 +494,155 @@ class EpieosLookup(OSINTModule):
             pass
         return None
 
+    @_cached("Microsoft")
     async def _check_microsoft(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://login.live.com/GetCredentialType.srf",
                 json={"username": email},
-                headers={
-                    "User-Agent": "Mozilla/5.0",
-                    "Content-Type": "application/json",
-                },
+                headers=_JSON_HEADERS,
+                retry=True,
                 timeout=10.0,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 if data.get("IfExistsResult") == 0:
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("GitHub")
     async def _check_github(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://github.com/signup_check/email",
                 data={"value": email},
-                headers={"User-Agent": "Mozilla/5.0"},
+                headers=_UA_HEADERS,
                 timeout=10.0,
             )
             if resp.status_code == 200:
-                if "already taken" in resp.text.lower() or resp.text.strip() == "false":
+                if _GITHUB_TAKEN_RE.search(resp.content) or resp.content.strip() == b"false":
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    @_cached("Pinterest")
     async def _check_pinterest(self, client: httpx.AsyncClient, email: str) -> dict | None:
         try:
-            resp = await client.post(
+            resp = await self._request(
+                client, "POST",
                 "https://www.pinterest.com/resource/EmailExistsResource/get/",
-                data={"data": f'{{"options": {{"email": "{email}"}}}}'},
-                headers={"User-Agent": "Mozilla/5.0"},
+                data={"data": orjson.dumps({"options": {"email": email}}).decode()},
+                headers=_UA_HEADERS,
+                retry=True,
                 timeout=10.0,
             )
             if resp.status_code == 200:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 if data.get("resource_response", {}).get("data"):
                     return {"exists": True}
         except Exception:
             pass
         return None
 
+    def _google_findings(self, google: dict, parent_id: str | None, now: datetime) -> list[Finding]:
+        """Findings for the Google account phase."""
+        if not google.get("has_google_account"):
+            return []
+
+        return [_GOOGLE_ACCOUNT(
+            id=finding_id(),
+            timestamp=now,
+            data={
+                "has_profile_photo": google.get("has_profile_photo", False),
+                "has_maps_activity": google.get("has_maps_activity", False),
+                "photo_hash": google.get("photo_hash"),
+                "photo_hash_alg": "blake2b-128",
+            },
+            parent_id=parent_id,
+        )]
+
+    def _gravatar_findings(self, gravatar: dict, parent_id: str | None, now: datetime) -> list[Finding]:
+        """Findings for the Gravatar profile phase."""
+        findings = []
+
+        # Name found
+        name = gravatar.get("display_name") or gravatar.get("name", {}).get("formatted")
+        if name:
+            findings.append(_GRAVATAR_NAME(
+                id=finding_id(),
+                title=f"Name: {name}",
+                source_url=_GRAVATAR_PROFILE_URL + str(gravatar.get("hash")),
+                timestamp=now,
+                data={
+                    "name": name,
+                    "source": "gravatar",
+                },
+                parent_id=parent_id,
+            ))
+
+        # Location
+        if gravatar.get("location"):
+            findings.append(_GRAVATAR_LOCATION(
+                id=finding_id(),
+                title=f"Location: {gravatar['location']}",
+                timestamp=now,
+                data={
+                    "location": gravatar["location"],
+                    "source": "gravatar",
+                },
+                parent_id=parent_id,
+            ))
+
+        # Linked accounts
+        if gravatar.get("accounts"):
+            findings.append(_GRAVATAR_ACCOUNTS(
+                id=finding_id(),
+                title=f"Linked Accounts: {len(gravatar['accounts'])}",
+                description=", ".join([a["platform"] for a in gravatar["accounts"][:5]]),
+                timestamp=now,
+                data={
+                    "accounts": gravatar["accounts"],
+                },
+                parent_id=parent_id,
+            ))
+
+        return findings
+
+    def _services_summary(self, services: list[dict], parent_id: str | None, now: datetime) -> Finding:
+        """Summary finding for the service registration (holehe-style) phase."""
+        service_names = [s["service"] for s in services]
+
+        return _SERVICES_SUMMARY(
+            id=finding_id(),
+            title=f"Registered Services: {len(services)}",
+            description=f"Found on: {', '.join(service_names)}",
+            timestamp=now,
+            data={
+                "services": services,
+                "count": len(services),
+            },
+            parent_id=parent_id,
+        )
+
+    def _service_finding(self, service: dict, parent_id: str | None, now: datetime) -> Finding:
+        """Individual finding for an important registered service."""
+        return _SERVICE_ACCOUNT(
+            id=finding_id(),
+            title=f"Account: {service['service']}",
+            description=f"Email is registered on {service['service']}",
+            timestamp=now,
+            data={
+                "service": service["service"],
+                "registered": True,
+            },
+            parent_id=parent_id,
+        )
+
     async def run(
         self,
         seed: str,
@@ -322,133 +652,59 @@ class EpieosLookup(OSINTModule):
         """Perform deep email intelligence gathering."""
 
         email = seed.lower().strip()
-        if '@' not in email:
+        if not EMAIL_RE.match(email):
             return
 
-        async with httpx.AsyncClient() as client:
-            # Check Google account
-            google = await self._check_google_account(client, email)
-
-            if google:
-                if google.get("has_google_account"):
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.ACCOUNT,
-                        severity=Severity.MEDIUM,
-                        title="Google Account Detected",
-                        description="Email is associated with a Google account",
-                        source="Google OSINT",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "has_profile_photo": google.get("has_profile_photo", False),
-                            "has_maps_activity": google.get("has_maps_activity", False),
-                            "photo_hash": google.get("photo_hash"),
-                        },
-                        parent_id=parent_id,
-                        link_label="has account",
-                    )
-
-            import asyncio
-            await asyncio.sleep(1)
-
-            # Check Gravatar
-            gravatar = await self._check_gravatar(client, email)
-
-            if gravatar:
-                # Name found
-                name = gravatar.get("display_name") or gravatar.get("name", {}).get("formatted")
-                if name:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.PERSONAL_INFO,
-                        severity=Severity.HIGH,
-                        title=f"Name: {name}",
-                        description="Name found via Gravatar profile",
-                        source="Gravatar",
-                        source_url=f"https://gravatar.com/{gravatar.get('hash')}",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "name": name,
-                            "source": "gravatar",
-                        },
-                        parent_id=parent_id,
-                        link_label="named",
-                    )
-
-                # Location
-                if gravatar.get("location"):
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.PERSONAL_INFO,
-                        severity=Severity.MEDIUM,
-                        title=f"Location: {gravatar['location']}",
-                        description="Location from Gravatar profile",
-                        source="Gravatar",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "location": gravatar["location"],
-                            "source": "gravatar",
-                        },
-                        parent_id=parent_id,
-                        link_label="located in",
-                    )
-
-                # Linked accounts
-                if gravatar.get("accounts"):
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.ACCOUNT,
-                        severity=Severity.MEDIUM,
-                        title=f"Linked Accounts: {len(gravatar['accounts'])}",
-                        description=", ".join([a["platform"] for a in gravatar["accounts"][:5]]),
-                        source="Gravatar",
-                        timestamp=datetime.utcnow(),
-                        data={
-                            "accounts": gravatar["accounts"],
-                        },
-                        parent_id=parent_id,
-                        link_label="linked to",
-                    )
-
-            await asyncio.sleep(1)
-
-            # Check service registrations (holehe-style)
-            services = await self._check_holehe_services(client, email)
-
-            if services:
-                service_names = [s["service"] for s in services]
-
-                yield Finding(
-                    id=str(uuid.uuid4()),
-                    type=NodeType.ACCOUNT,
-                    severity=Severity.MEDIUM,
-                    title=f"Registered Services: {len(services)}",
-                    description=f"Found on: {', '.join(service_names)}",
-                    source="Email Registration Check",
-                    timestamp=datetime.utcnow(),
-                    data={
-                        "services": services,
-                        "count": len(services),
-                    },
-                    parent_id=parent_id,
-                    link_label="registered on",
-                )
-
-                # Individual findings for important services
-                for service in services:
-                    if service["service"] in ["Twitter", "Instagram", "Discord", "GitHub"]:
-                        yield Finding(
-                            id=str(uuid.uuid4()),
-                            type=NodeType.ACCOUNT,
-                            severity=Severity.MEDIUM,
-                            title=f"Account: {service['service']}",
-                            description=f"Email is registered on {service['service']}",
-                            source="Email Registration Check",
-                            timestamp=datetime.utcnow(),
-                            data={
-                                "service": service["service"],
-                                "registered": True,
-                            },
-                            parent_id=parent_id,
-                            link_label="account on",
-                        )
+        client = get_http_client()
+
+        # One snapshot time for every finding of this run
+        now = datetime.utcnow()
+
+        # Google, Gravatar and the service checks are independent and run
+        # together. Producers push findings as soon as they have them, then
+        # None once done; run() drains the queue until every producer is done.
+        found: asyncio.Queue[Finding | None] = asyncio.Queue()
+
+        async def phase(check, build):
+            try:
+                async with asyncio.timeout(self.check_timeout) as budget:
+                    CHECK_DEADLINE.set(budget.when())
+                    result = await check(client, email)
+                if result:
+                    for finding in build(result, parent_id, now):
+                        found.put_nowait(finding)
+            except TimeoutError:
+                pass
+            finally:
+                found.put_nowait(None)
+
+        async def holehe():
+            try:
+                registered = []
+                async for service in self._iter_holehe(client, email):
+                    registered.append(service)
+                    if service["service"] in _ACCOUNT_FINDING_SERVICES:
+                        found.put_nowait(self._service_finding(service, parent_id, now))
+                if registered:
+                    found.put_nowait(self._services_summary(registered, parent_id, now))
+            finally:
+                found.put_nowait(None)
+
+        tasks = [
+            asyncio.create_task(phase(self._check_google_account, self._google_findings)),
+            asyncio.create_task(phase(self._check_gravatar, self._gravatar_findings)),
+            asyncio.create_task(holehe()),
+        ]
+
+        try:
+            running = len(tasks)
+            while running:
+                finding = await found.get()
+                if finding is None:
+                    running -= 1
+                else:
+                    yield finding
+        finally:
+            # Consumer stopped early (or was cancelled): drop unfinished work
+            for task in tasks:
+                task.cancel()
@@ -4,29 +4,227 @@ Extracts: commit emails, org memberships, linked socials, timezone inference.
 """
 
 import httpx
-import uuid
-import re
+import orjson
+import asyncio
+import time
+import hashlib
+from urllib.parse import urlencode
 from typing import AsyncGenerator
 from datetime import datetime
 from collections import Counter
 
 from .base import OSINTModule
-from models.findings import Finding, NodeType, Severity
+from models.findings import Finding, NodeType, Severity, finding_id
 from config import settings
-
+from services.http import get_http_client
+from services.upstream import HostThrottle, SingleFlight, TTLCache
+
+# Caps concurrent API calls across every scan, so parallel seeds do not
+# trip GitHub's secondary (abuse) rate limit, and holds every call back
+# while the Retry-After / X-RateLimit-* headers say the quota is spent
+_API_HOST = "api.github.com"
+_API = HostThrottle(per_host=10, max_wait=10.0, low_water=1)
+
+
+# Parsed API responses by (auth identity, URL): (etag, body). Expired
+# entries are kept so their ETag can revalidate them; a 304 costs no rate
+# limit. The token is part of the key because it changes what the API
+# returns (e.g. the profile email).
+_RESPONSE_CACHE = TTLCache(ttl=300.0, maxsize=1024)
+
+# Requests currently running, by the same key as _RESPONSE_CACHE
+_INFLIGHT = SingleFlight()
+
+
+def _is_rate_limited(resp: httpx.Response) -> bool:
+    """True for 429s and for 403s caused by an exhausted or abuse rate limit."""
+    if resp.status_code == 429:
+        return True
+    return resp.status_code == 403 and (
+        "retry-after" in resp.headers or resp.headers.get("x-ratelimit-remaining") == "0"
+    )
+
+
+# One repo listing serves both the commit scan and the language stats.
+# The stats therefore cover the 100 most recently pushed repos; for
+# accounts with more than 100 that is a different 100 than the API's
+# default (name) order, otherwise the same set.
+_REPO_LIST_PARAMS = {"sort": "pushed", "per_page": 100}
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Profile plus, for deep scans, the same repo and org listings as the REST
+# calls (public, owned repos, most recently pushed first)
+_PROFILE_QUERY = """
+query($login: String!, $deep: Boolean!) {
+  user(login: $login) {
+    login name email company location bio websiteUrl twitterUsername
+    url avatarUrl createdAt
+    followers { totalCount }
+    following { totalCount }
+    publicRepos: repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    repositories(
+      first: 100, privacy: PUBLIC, ownerAffiliations: OWNER,
+      orderBy: {field: PUSHED_AT, direction: DESC}
+    ) @include(if: $deep) {
+      nodes { nameWithOwner stargazerCount primaryLanguage { name } }
+    }
+    organizations(first: 100) @include(if: $deep) {
+      nodes { login description avatarUrl }
+    }
+  }
+}
+"""
 
 class GitHubLookup(OSINTModule):
     name = "GitHub Deep Scan"
     description = "Deep GitHub profile analysis including commit emails"
 
     def __init__(self):
-        self.timeout = 15.0
         self.headers = {
             "User-Agent": "TRACE-OSINT",
             "Accept": "application/vnd.github.v3+json",
         }
+        # Response cache namespace: a digest of the token, never the token
+        self.auth_id = ""
         if settings.GITHUB_TOKEN:
             self.headers["Authorization"] = f"token {settings.GITHUB_TOKEN}"
+            self.auth_id = hashlib.sha256(settings.GITHUB_TOKEN.encode()).hexdigest()[:16]
+        self.max_retries = 2
+
+    def _cache_key(self, url: str, params: dict | None = None) -> tuple[str, str]:
+        """Response cache key for a GET of url with params under this token."""
+        return self.auth_id, (f"{url}?{urlencode(sorted(params.items()))}" if params else url)
+
+    async def _get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """GET an API URL within the rate limit, retrying rate-limited responses."""
+        extra = kwargs.pop("headers", None)
+        headers = {**self.headers, **extra} if extra else self.headers
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            async with _API.slot(_API_HOST):
+                resp = await client.get(url, headers=headers, **kwargs)
+            _API.note(_API_HOST, resp)
+
+            if not _is_rate_limited(resp) or attempt == self.max_retries:
+                return resp
+
+            # A header-driven wait is taken on the next attempt; without
+            # one, back off exponentially
+            if _API.ready_in(_API_HOST) <= 0:
+                await asyncio.sleep(delay)
+                delay *= 2
+        return resp
+
+    async def _get_json(self, client: httpx.AsyncClient, url: str, params: dict | None = None):
+        """
+        GET an API URL and return its parsed JSON, or None for a non-200 answer.
+
+        Responses are cached for a few minutes and revalidated by ETag after
+        that; concurrent calls for the same URL share one request.
+        """
+        key = self._cache_key(url, params)
+        entry = _RESPONSE_CACHE.peek(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1][1]
+        return await _INFLIGHT.run(key, lambda: self._fetch_json(client, key, entry, url, params))
+
+    async def _fetch_json(self, client: httpx.AsyncClient, key, entry, url: str, params: dict | None):
+        """Fetch (or revalidate by ETag) one API response and cache its parsed body."""
+        etag = entry[1][0] if entry is not None else None
+        resp = await self._get(
+            client, url,
+            params=params,
+            headers={"If-None-Match": etag} if etag else None,
+        )
+        if resp.status_code == 304 and entry is not None:
+            body = entry[1][1]
+        elif resp.status_code == 200:
+            body = orjson.loads(resp.content)
+        else:
+            return None
+        _RESPONSE_CACHE.put(key, (resp.headers.get("etag") or etag, body))
+        return body
+
+    async def _list_repos(self, client: httpx.AsyncClient, username: str) -> list | None:
+        """User's public repos, most recently pushed first (one cached request)."""
+        return await self._get_json(
+            client,
+            f"https://api.github.com/users/{username}/repos",
+            _REPO_LIST_PARAMS,
+        )
+
+    async def _prefetch_graphql(self, client: httpx.AsyncClient, username: str, deep: bool):
+        """
+        Load the profile (and, for deep scans, repos and orgs) in one GraphQL query.
+
+        The results are stored in the response cache under the REST URLs that
+        run() and the deep-scan helpers read, translated to the REST shapes, so
+        those reads are served without further requests. GraphQL needs a
+        token; without one, or on any failure, the REST calls run as usual.
+        """
+        user_url = f"https://api.github.com/users/{username}"
+        entry = _RESPONSE_CACHE.peek(self._cache_key(user_url))
+        if not settings.GITHUB_TOKEN or (entry is not None and entry[0] > time.monotonic()):
+            return
+
+        try:
+            # Gated like _get: this one query costs the most quota
+            async with _API.slot(_API_HOST):
+                resp = await client.post(
+                    _GRAPHQL_URL,
+                    json={"query": _PROFILE_QUERY, "variables": {"login": username, "deep": deep}},
+                    headers=self.headers,
+                )
+            _API.note(_API_HOST, resp)
+            if resp.status_code != 200:
+                return
+            user = (orjson.loads(resp.content).get("data") or {}).get("user")
+            if not user:
+                return
+
+            # A partial GraphQL error nulls the affected field; any missing
+            # piece raises here and nothing is cached, so REST covers it all
+            profile = {
+                "login": user.get("login"),
+                "name": user.get("name"),
+                "email": user.get("email") or None,
+                "company": user.get("company"),
+                "location": user.get("location"),
+                "bio": user.get("bio"),
+                "blog": user.get("websiteUrl") or "",
+                "twitter_username": user.get("twitterUsername"),
+                "html_url": user.get("url"),
+                "avatar_url": user.get("avatarUrl"),
+                "created_at": user.get("createdAt"),
+                "public_repos": user["publicRepos"]["totalCount"],
+                "followers": user["followers"]["totalCount"],
+                "following": user["following"]["totalCount"],
+            }
+            if deep:
+                repos = [
+                    {
+                        "full_name": repo["nameWithOwner"],
+                        "language": (repo.get("primaryLanguage") or {}).get("name"),
+                        "stargazers_count": repo.get("stargazerCount", 0),
+                    }
+                    for repo in user["repositories"]["nodes"]
+                ]
+                orgs = [
+                    {
+                        "login": org["login"],
+                        "avatar_url": org.get("avatarUrl"),
+                        "description": org.get("description"),
+                    }
+                    for org in user["organizations"]["nodes"]
+                ]
+        except Exception:
+            return
+
+        _RESPONSE_CACHE.put(self._cache_key(user_url), (None, profile))
+        if deep:
+            _RESPONSE_CACHE.put(self._cache_key(f"{user_url}/repos", _REPO_LIST_PARAMS), (None, repos))
+            _RESPONSE_CACHE.put(self._cache_key(f"{user_url}/orgs"), (None, orgs))
 
     async def _get_commit_emails(self, client: httpx.AsyncClient, username: str) -> list[dict]:
         """Extract unique emails from user's commit history."""
@@ -35,52 +233,45 @@ class GitHubLookup(OSINTModule):
 
         try:
             # Get user's repos
-            resp = await client.get(
-                f"https://api.github.com/users/{username}/repos",
-                params={"sort": "pushed", "per_page": 10},
-                timeout=self.timeout,
-            )
-            if resp.status_code != 200:
+            repos = await self._list_repos(client, username)
+            if repos is None:
                 return emails
 
-            repos = resp.json()
-
-            for repo in repos[:5]:  # Check top 5 most recent repos
-                repo_name = repo.get("full_name")
-                if not repo_name:
-                    continue
+            async def fetch_commits(repo_name: str) -> list:
+                commits = await self._get_json(
+                    client,
+                    f"https://api.github.com/repos/{repo_name}/commits",
+                    {"author": username, "per_page": 30},
+                )
+                return commits or []
 
-                # Get commits
-                try:
-                    commits_resp = await client.get(
-                        f"https://api.github.com/repos/{repo_name}/commits",
-                        params={"author": username, "per_page": 30},
-                        timeout=self.timeout,
-                    )
-                    if commits_resp.status_code != 200:
-                        continue
+            # Check top 5 most recent repos; the per-repo fetches are independent
+            repo_names = [r["full_name"] for r in repos[:5] if r.get("full_name")]
+            results = await asyncio.gather(
+                *(fetch_commits(repo_name) for repo_name in repo_names),
+                return_exceptions=True,
+            )
 
-                    commits = commits_resp.json()
-
-                    for commit in commits:
-                        commit_data = commit.get("commit", {})
-                        author = commit_data.get("author", {})
-                        email = author.get("email", "")
-                        name = author.get("name", "")
-
-                        # Skip GitHub noreply emails
-                        if email and "noreply" not in email.lower() and email not in seen:
-                            seen.add(email)
-                            emails.append({
-                                "email": email,
-                                "name": name,
-                                "repo": repo_name,
-                                "date": author.get("date"),
-                            })
-
-                except Exception:
+            for repo_name, commits in zip(repo_names, results):
+                if isinstance(commits, BaseException):
                     continue
 
+                for commit in commits:
+                    commit_data = commit.get("commit", {})
+                    author = commit_data.get("author", {})
+                    email = author.get("email", "")
+                    name = author.get("name", "")
+
+                    # Skip GitHub noreply emails
+                    if email and "noreply" not in email.lower() and email not in seen:
+                        seen.add(email)
+                        emails.append({
+                            "email": email,
+                            "name": name,
+                            "repo": repo_name,
+                            "date": author.get("date"),
+                        })
+
         except Exception as e:
             print(f"[GitHub] Commit email extraction error: {e}")
 
@@ -90,12 +281,12 @@ class GitHubLookup(OSINTModule):
         """Get user's organization memberships."""
         orgs = []
         try:
-            resp = await client.get(
+            data = await self._get_json(
+                client,
                 f"https://api.github.com/users/{username}/orgs",
-                timeout=self.timeout,
             )
-            if resp.status_code == 200:
-                for org in resp.json():
+            if data is not None:
+                for org in data:
                     orgs.append({
                         "login": org.get("login"),
                         "url": f"https://github.com/{org.get('login')}",
@@ -117,13 +308,8 @@ class GitHubLookup(OSINTModule):
 
         try:
             # Get repos for language analysis
-            resp = await client.get(
-                f"https://api.github.com/users/{username}/repos",
-                params={"per_page": 100},
-                timeout=self.timeout,
-            )
-            if resp.status_code == 200:
-                repos = resp.json()
+            repos = await self._list_repos(client, username)
+            if repos is not None:
                 stats["total_repos"] = len(repos)
                 stats["total_stars"] = sum(r.get("stargazers_count", 0) for r in repos)
 
@@ -136,22 +322,19 @@ class GitHubLookup(OSINTModule):
                 stats["languages"] = [{"name": k, "count": v} for k, v in languages.most_common(5)]
 
             # Get events for activity timing
-            resp = await client.get(
+            events = await self._get_json(
+                client,
                 f"https://api.github.com/users/{username}/events/public",
-                params={"per_page": 100},
-                timeout=self.timeout,
+                {"per_page": 100},
             )
-            if resp.status_code == 200:
-                events = resp.json()
-                hours = []
-                for event in events:
-                    created = event.get("created_at")
-                    if created:
-                        try:
-                            dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-                            hours.append(dt.hour)
-                        except Exception:
-                            pass
+            if events is not None:
+                # created_at is always UTC "YYYY-MM-DDTHH:MM:SSZ"; slice the
+                # hour out instead of parsing the whole timestamp
+                hours = [
+                    int(created[11:13])
+                    for event in events
+                    if (created := event.get("created_at")) and created[11:13].isdigit()
+                ]
                 stats["commit_hours"] = hours
 
         except Exception:
@@ -203,263 +386,275 @@ class GitHubLookup(OSINTModule):
         if not username:
             return
 
-        async with httpx.AsyncClient(headers=self.headers) as client:
-            try:
-                # Get user profile
-                resp = await client.get(
-                    f"https://api.github.com/users/{username}",
-                    timeout=self.timeout,
+        # Shared pooled client (HTTP/2, keep-alive) reused across runs
+        client = get_http_client()
+
+        # One snapshot time for every finding of this run
+        now = datetime.utcnow()
+
+        try:
+            # With a token, one GraphQL query stands in for the profile,
+            # repo and org REST calls below
+            await self._prefetch_graphql(client, username, depth >= 2)
+
+            # Get user profile
+            data = await self._get_json(
+                client,
+                f"https://api.github.com/users/{username}",
+            )
+
+            if data is None:
+                return
+
+            profile_url = data.get("html_url", f"https://github.com/{username}")
+
+            # Build rich description
+            repos = data.get("public_repos", 0)
+            followers = data.get("followers", 0)
+            location = data.get("location", "")
+            company = data.get("company", "")
+
+            desc_parts = [f"{repos} repos", f"{followers} followers"]
+            if location:
+                desc_parts.append(location)
+            if company:
+                desc_parts.append(company)
+
+            # Main profile finding
+            yield Finding.build(
+                id=finding_id(),
+                type=NodeType.ACCOUNT,
+                severity=Severity.MEDIUM,
+                title=f"GitHub: {username} ({', '.join(desc_parts[:3])})",
+                description=f"Active GitHub account with {repos} public repositories",
+                source="GitHub API",
+                source_url=profile_url,
+                timestamp=now,
+                data={
+                    "username": username,
+                    "url": profile_url,
+                    "repos": repos,
+                    "followers": followers,
+                    "following": data.get("following", 0),
+                    "created": data.get("created_at"),
+                    "avatar_url": data.get("avatar_url"),
+                },
+                parent_id=parent_id,
+                link_label="profile on",
+            )
+
+            # Real name (HIGH severity - PII)
+            name = data.get("name")
+            if name and name.lower() != username.lower():
+                yield Finding.build(
+                    id=finding_id(),
+                    type=NodeType.PERSONAL_INFO,
+                    severity=Severity.HIGH,
+                    title=f"Real Name: {name}",
+                    description="Name from GitHub profile",
+                    source="GitHub",
+                    source_url=profile_url,
+                    timestamp=now,
+                    data={"name": name, "source": "github_profile"},
+                    parent_id=parent_id,
+                    link_label="real name",
                 )
 
-                if resp.status_code != 200:
-                    return
+            # Location
+            if location:
+                yield Finding.build(
+                    id=finding_id(),
+                    type=NodeType.PERSONAL_INFO,
+                    severity=Severity.MEDIUM,
+                    title=f"Location: {location}",
+                    description="Location from GitHub profile",
+                    source="GitHub",
+                    source_url=profile_url,
+                    timestamp=now,
+                    data={"location": location, "source": "github_profile", "confidence": "high"},
+                    parent_id=parent_id,
+                    link_label="located in",
+                )
 
-                data = resp.json()
-                profile_url = data.get("html_url", f"https://github.com/{username}")
+            # Company/Employer
+            if company:
+                # Clean up company name (remove @ if present)
+                company_clean = company.lstrip("@").strip()
+                yield Finding.build(
+                    id=finding_id(),
+                    type=NodeType.PERSONAL_INFO,
+                    severity=Severity.HIGH,
+                    title=f"Employer: {company_clean}",
+                    description="Company from GitHub profile",
+                    source="GitHub",
+                    source_url=profile_url,
+                    timestamp=now,
+                    data={"company": company_clean, "raw": company},
+                    parent_id=parent_id,
+                    link_label="works at",
+                )
 
-                # Build rich description
-                repos = data.get("public_repos", 0)
-                followers = data.get("followers", 0)
-                location = data.get("location", "")
-                company = data.get("company", "")
+            # Public email from profile
+            email = data.get("email")
+            if email:
+                yield Finding.build(
+                    id=finding_id(),
+                    type=NodeType.PERSONAL_INFO,
+                    severity=Severity.HIGH,
+                    title=f"Public Email: {email}",
+                    description="Email publicly displayed on GitHub profile",
+                    source="GitHub",
+                    source_url=profile_url,
+                    timestamp=now,
+                    data={"email": email, "source": "github_profile"},
+                    parent_id=parent_id,
+                    link_label="email on",
+                )
+
+            # Twitter handle (linked social)
+            twitter = data.get("twitter_username")
+            if twitter:
+                yield Finding.build(
+                    id=finding_id(),
+                    type=NodeType.ACCOUNT,
+                    severity=Severity.MEDIUM,
+                    title=f"Linked Twitter: @{twitter}",
+                    description="Twitter account linked on GitHub profile",
+                    source="GitHub",
+                    source_url=f"https://twitter.com/{twitter}",
+                    timestamp=now,
+                    data={"twitter": twitter, "url": f"https://twitter.com/{twitter}"},
+                    parent_id=parent_id,
+                    link_label="links to",
+                )
 
-                desc_parts = [f"{repos} repos", f"{followers} followers"]
-                if location:
-                    desc_parts.append(location)
-                if company:
-                    desc_parts.append(company)
+            # Blog/Website
+            blog = data.get("blog")
+            if blog:
+                if not blog.startswith(('http://', 'https://')):
+                    blog = f"https://{blog}"
 
-                # Main profile finding
-                yield Finding(
-                    id=str(uuid.uuid4()),
+                yield Finding.build(
+                    id=finding_id(),
                     type=NodeType.ACCOUNT,
                     severity=Severity.MEDIUM,
-                    title=f"GitHub: {username} ({', '.join(desc_parts[:3])})",
-                    description=f"Active GitHub account with {repos} public repositories",
-                    source="GitHub API",
-                    source_url=profile_url,
-                    timestamp=datetime.utcnow(),
-                    data={
-                        "username": username,
-                        "url": profile_url,
-                        "repos": repos,
-                        "followers": followers,
-                        "following": data.get("following", 0),
-                        "created": data.get("created_at"),
-                        "avatar_url": data.get("avatar_url"),
-                    },
+                    title=f"Website: {blog}",
+                    description="Personal website linked on GitHub profile",
+                    source="GitHub",
+                    source_url=blog,
+                    timestamp=now,
+                    data={"url": blog, "type": "personal_website"},
                     parent_id=parent_id,
-                    link_label="profile on",
+                    link_label="website",
                 )
 
-                # Real name (HIGH severity - PII)
-                name = data.get("name")
-                if name and name.lower() != username.lower():
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.PERSONAL_INFO,
-                        severity=Severity.HIGH,
-                        title=f"Real Name: {name}",
-                        description="Name from GitHub profile",
-                        source="GitHub",
-                        source_url=profile_url,
-                        timestamp=datetime.utcnow(),
-                        data={"name": name, "source": "github_profile"},
-                        parent_id=parent_id,
-                        link_label="real name",
-                    )
+            # Bio analysis
+            bio = data.get("bio")
+            if bio:
+                yield Finding.build(
+                    id=finding_id(),
+                    type=NodeType.PERSONAL_INFO,
+                    severity=Severity.LOW,
+                    title="Bio",
+                    description=bio[:200] + ("..." if len(bio) > 200 else ""),
+                    source="GitHub",
+                    timestamp=now,
+                    data={"bio": bio},
+                    parent_id=parent_id,
+                    link_label="bio from",
+                )
 
-                # Location
-                if location:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.PERSONAL_INFO,
-                        severity=Severity.MEDIUM,
-                        title=f"Location: {location}",
-                        description="Location from GitHub profile",
-                        source="GitHub",
-                        source_url=profile_url,
-                        timestamp=datetime.utcnow(),
-                        data={"location": location, "source": "github_profile", "confidence": "high"},
-                        parent_id=parent_id,
-                        link_label="located in",
-                    )
+            # === DEEP SCAN (depth >= 2) ===
+            if depth >= 2:
+                # Commit emails, orgs and contribution stats hit separate
+                # endpoints; fetch them together
+                commit_emails, orgs, stats = await asyncio.gather(
+                    self._get_commit_emails(client, username),
+                    self._get_organizations(client, username),
+                    self._get_contribution_stats(client, username),
+                )
 
-                # Company/Employer
-                if company:
-                    # Clean up company name (remove @ if present)
-                    company_clean = company.lstrip("@").strip()
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.PERSONAL_INFO,
-                        severity=Severity.HIGH,
-                        title=f"Employer: {company_clean}",
-                        description="Company from GitHub profile",
-                        source="GitHub",
-                        source_url=profile_url,
-                        timestamp=datetime.utcnow(),
-                        data={"company": company_clean, "raw": company},
-                        parent_id=parent_id,
-                        link_label="works at",
-                    )
+                # Commit emails
+                for ce in commit_emails:
+                    email_addr = ce["email"]
+                    # Skip if same as profile email
+                    if email and email_addr.lower() == email.lower():
+                        continue
 
-                # Public email from profile
-                email = data.get("email")
-                if email:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
+                    yield Finding.build(
+                        id=finding_id(),
                         type=NodeType.PERSONAL_INFO,
                         severity=Severity.HIGH,
-                        title=f"Public Email: {email}",
-                        description="Email publicly displayed on GitHub profile",
-                        source="GitHub",
-                        source_url=profile_url,
-                        timestamp=datetime.utcnow(),
-                        data={"email": email, "source": "github_profile"},
+                        title=f"Commit Email: {email_addr}",
+                        description=f"Email found in commit history ({ce.get('name', 'unknown')})",
+                        source="GitHub Commits",
+                        source_url=f"https://github.com/{ce.get('repo', username)}",
+                        timestamp=now,
+                        data={
+                            "email": email_addr,
+                            "commit_name": ce.get("name"),
+                            "repo": ce.get("repo"),
+                            "source": "git_commit",
+                        },
                         parent_id=parent_id,
-                        link_label="email on",
+                        link_label="commits as",
                     )
 
-                # Twitter handle (linked social)
-                twitter = data.get("twitter_username")
-                if twitter:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
+                # Organizations
+                for org in orgs:
+                    yield Finding.build(
+                        id=finding_id(),
                         type=NodeType.ACCOUNT,
-                        severity=Severity.MEDIUM,
-                        title=f"Linked Twitter: @{twitter}",
-                        description="Twitter account linked on GitHub profile",
+                        severity=Severity.LOW,
+                        title=f"Org: {org['login']}",
+                        description=org.get("description") or "GitHub organization member",
                         source="GitHub",
-                        source_url=f"https://twitter.com/{twitter}",
-                        timestamp=datetime.utcnow(),
-                        data={"twitter": twitter, "url": f"https://twitter.com/{twitter}"},
+                        source_url=org["url"],
+                        timestamp=now,
+                        data=org,
                         parent_id=parent_id,
-                        link_label="links to",
+                        link_label="member of",
                     )
 
-                # Blog/Website
-                blog = data.get("blog")
-                if blog:
-                    if not blog.startswith(('http://', 'https://')):
-                        blog = f"https://{blog}"
-
-                    yield Finding(
-                        id=str(uuid.uuid4()),
-                        type=NodeType.ACCOUNT,
-                        severity=Severity.MEDIUM,
-                        title=f"Website: {blog}",
-                        description="Personal website linked on GitHub profile",
-                        source="GitHub",
-                        source_url=blog,
-                        timestamp=datetime.utcnow(),
-                        data={"url": blog, "type": "personal_website"},
+                # Contribution stats and timezone inference
+                if stats["languages"]:
+                    top_langs = ", ".join(l["name"] for l in stats["languages"][:3])
+                    yield Finding.build(
+                        id=finding_id(),
+                        type=NodeType.PERSONAL_INFO,
+                        severity=Severity.LOW,
+                        title=f"Primary Languages: {top_langs}",
+                        description=f"Most used programming languages across {stats['total_repos']} repos",
+                        source="GitHub Analysis",
+                        timestamp=now,
+                        data={
+                            "languages": stats["languages"],
+                            "total_repos": stats["total_repos"],
+                            "total_stars": stats["total_stars"],
+                        },
                         parent_id=parent_id,
-                        link_label="website",
+                        link_label="codes in",
                     )
 
-                # Bio analysis
-                bio = data.get("bio")
-                if bio:
-                    yield Finding(
-                        id=str(uuid.uuid4()),
+                # Timezone inference
+                tz_guess = self._infer_timezone(stats.get("commit_hours", []))
+                if tz_guess:
+                    yield Finding.build(
+                        id=finding_id(),
                         type=NodeType.PERSONAL_INFO,
-                        severity=Severity.LOW,
-                        title="Bio",
-                        description=bio[:200] + ("..." if len(bio) > 200 else ""),
-                        source="GitHub",
-                        timestamp=datetime.utcnow(),
-                        data={"bio": bio},
+                        severity=Severity.MEDIUM,
+                        title=f"Timezone: {tz_guess}",
+                        description="Timezone inferred from commit activity patterns",
+                        source="GitHub Activity Analysis",
+                        timestamp=now,
+                        data={
+                            "timezone_guess": tz_guess,
+                            "sample_size": len(stats.get("commit_hours", [])),
+                            "confidence": "medium",
+                        },
                         parent_id=parent_id,
-                        link_label="bio from",
+                        link_label="active in",
                     )
 
-                # === DEEP SCAN (depth >= 2) ===
-                if depth >= 2:
-                    # Extract commit emails
-                    commit_emails = await self._get_commit_emails(client, username)
-                    for ce in commit_emails:
-                        email_addr = ce["email"]
-                        # Skip if same as profile email
-                        if email and email_addr.lower() == email.lower():
-                            continue
-
-                        yield Finding(
-                            id=str(uuid.uuid4()),
-                            type=NodeType.PERSONAL_INFO,
-                            severity=Severity.HIGH,
-                            title=f"Commit Email: {email_addr}",
-                            description=f"Email found in commit history ({ce.get('name', 'unknown')})",
-                            source="GitHub Commits",
-                            source_url=f"https://github.com/{ce.get('repo', username)}",
-                            timestamp=datetime.utcnow(),
-                            data={
-                                "email": email_addr,
-                                "commit_name": ce.get("name"),
-                                "repo": ce.get("repo"),
-                                "source": "git_commit",
-                            },
-                            parent_id=parent_id,
-                            link_label="commits as",
-                        )
-
-                    # Get organizations
-                    orgs = await self._get_organizations(client, username)
-                    for org in orgs:
-                        yield Finding(
-                            id=str(uuid.uuid4()),
-                            type=NodeType.ACCOUNT,
-                            severity=Severity.LOW,
-                            title=f"Org: {org['login']}",
-                            description=org.get("description") or "GitHub organization member",
-                            source="GitHub",
-                            source_url=org["url"],
-                            timestamp=datetime.utcnow(),
-                            data=org,
-                            parent_id=parent_id,
-                            link_label="member of",
-                        )
-
-                    # Contribution stats and timezone inference
-                    stats = await self._get_contribution_stats(client, username)
-
-                    if stats["languages"]:
-                        top_langs = ", ".join(l["name"] for l in stats["languages"][:3])
-                        yield Finding(
-                            id=str(uuid.uuid4()),
-                            type=NodeType.PERSONAL_INFO,
-                            severity=Severity.LOW,
-                            title=f"Primary Languages: {top_langs}",
-                            description=f"Most used programming languages across {stats['total_repos']} repos",
-                            source="GitHub Analysis",
-                            timestamp=datetime.utcnow(),
-                            data={
-                                "languages": stats["languages"],
-                                "total_repos": stats["total_repos"],
-                                "total_stars": stats["total_stars"],
-                            },
-                            parent_id=parent_id,
-                            link_label="codes in",
-                        )
-
-                    # Timezone inference
-                    tz_guess = self._infer_timezone(stats.get("commit_hours", []))
-                    if tz_guess:
-                        yield Finding(
-                            id=str(uuid.uuid4()),
-                            type=NodeType.PERSONAL_INFO,
-                            severity=Severity.MEDIUM,
-                            title=f"Timezone: {tz_guess}",
-                            description="Timezone inferred from commit activity patterns",
-                            source="GitHub Activity Analysis",
-                            timestamp=datetime.utcnow(),
-                            data={
-                                "timezone_guess": tz_guess,
-                                "sample_size": len(stats.get("commit_hours", [])),
-                                "confidence": "medium",
-                            },
-                            parent_id=parent_id,
-                            link_label="active in",
-                        )
-
-            except Exception as e:
-                print(f"[GitHub] Error: {e}")
+        except Exception as e:
+            print(f"[GitHub] Error: {e}")
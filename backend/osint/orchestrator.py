@@ -2,40 +2,12 @@
 
 import asyncio
 import time
-import uuid
 import json
 from typing import AsyncGenerator, Callable
 from datetime import datetime
 
-from models.findings import Finding, NodeType, Severity
-from .modules import (
-    # HOP 1 - Direct Email Intelligence
-    BreachLookup,
-    EpieosLookup,
-    ReverseLookup,
-    GoogleDork,
-    PasteSearch,
-    GravatarLookup,
-    UsernameExtractor,
-
-    # HOP 1.5 - Username Discovery (email-based)
-    GitHubEmailSearch,
-    KeybaseLookup,
-    IntelXSearch,
-    HudsonRockSearch,
-
-    # HOP 2 - Username Expansion
-    UsernameChecker,
-    GitHubLookup,
-    GitHubSecrets,
-    SocialDeepDive,
-    WaybackLookup,
-
-    # HOP 3 - Aggregation
-    DataBrokerCheck,
-    LocationInference,
-    ConnectedAccountFinder,
-)
+from models.findings import Finding, NodeType, Severity, finding_id
+from . import modules
 from .risk import calculate_risk_score
 
 
@@ -108,30 +80,29 @@ class ScanOrchestrator:
         parent_id: str,
         log: Callable,
         on_finding: Callable | None,
-    ) -> list[Finding]:
-        """Run a single module and collect findings."""
-        results = []
+    ) -> AsyncGenerator[list[Finding], None]:
+        """Run a single module, passing on each batch of findings as it arrives."""
         log(f"  >> {module.name}")
 
         try:
-            async for finding in module.run(seed, depth, parent_id):
-                self.findings.append(finding)
-                results.append(finding)
-                if on_finding:
-                    on_finding(finding)
+            async for batch in module.run_batches(seed, depth, parent_id):
+                self.findings.extend(batch)
+                for finding in batch:
+                    if on_finding:
+                        on_finding(finding)
 
-                # Collect metadata for correlation
-                self._collect_metadata(finding)
+                    # Collect metadata for correlation
+                    self._collect_metadata(finding)
 
-                log(f"     [+] {finding.title[:60]}", "SUCCESS")
+                    log(f"     [+] {finding.title[:60]}", "SUCCESS")
+
+                yield batch
 
         except asyncio.TimeoutError:
             log(f"     [!] Timeout: {module.name}", "WARN")
         except Exception as e:
             log(f"     [!] Error: {type(e).__name__}", "ERROR")
 
-        return results
-
     def _collect_metadata(self, finding: Finding):
         """Extract useful metadata from findings for later correlation."""
         data = finding.data or {}
@@ -216,7 +187,7 @@ class ScanOrchestrator:
         log("=" * 60)
 
         # Create root node
-        root_id = str(uuid.uuid4())
+        root_id = finding_id()
         masked = self._mask_email(email)
 
         root = Finding(
@@ -247,27 +218,27 @@ class ScanOrchestrator:
 
         hop1_modules = [
             # Direct email intelligence
-            BreachLookup(),       # XposedOrNot breaches
-            EpieosLookup(),       # Google account, service checks
-            ReverseLookup(),      # EmailRep, ThatsThem
-            GoogleDork(),         # Document search
-            PasteSearch(),        # Paste/leak site search
-            GravatarLookup(),     # Gravatar profile + username extraction
-            UsernameExtractor(),  # Extract username patterns from email
+            modules.BreachLookup(),       # XposedOrNot breaches
+            modules.EpieosLookup(),       # Google account, service checks
+            modules.ReverseLookup(),      # EmailRep, ThatsThem
+            modules.GoogleDork(),         # Document search
+            modules.PasteSearch(),        # Paste/leak site search
+            modules.GravatarLookup(),     # Gravatar profile + username extraction
+            modules.UsernameExtractor(),  # Extract username patterns from email
 
             # Username discovery (email-based searches)
-            GitHubEmailSearch(),  # Find GitHub users by commit email
-            KeybaseLookup(),      # Keybase verified proofs (Twitter, GitHub, etc.)
-            IntelXSearch(),       # IntelX leaked databases
-            HudsonRockSearch(),   # Stealer malware log search
+            modules.GitHubEmailSearch(),  # Find GitHub users by commit email
+            modules.KeybaseLookup(),      # Keybase verified proofs (Twitter, GitHub, etc.)
+            modules.IntelXSearch(),       # IntelX leaked databases
+            modules.HudsonRockSearch(),   # Stealer malware log search
         ]
 
         for module in hop1_modules:
-            results = await self._run_module(
+            async for batch in self._run_module(
                 module, email, depth, root_id, log, on_finding
-            )
-            for finding in results:
-                yield finding
+            ):
+                for finding in batch:
+                    yield finding
             await asyncio.sleep(0.5)
 
         # ==================== HOP 2 ====================
@@ -284,55 +255,55 @@ class ScanOrchestrator:
                 log(f"--- Expanding: {username} ---")
 
                 # Platform account checker
-                checker = UsernameChecker()
-                results = await self._run_module(
+                checker = modules.UsernameChecker()
+                async for batch in self._run_module(
                     checker, username, depth, root_id, log, on_finding
-                )
-                for finding in results:
-                    yield finding
+                ):
+                    for finding in batch:
+                        yield finding
                 await asyncio.sleep(0.5)
 
                 # GitHub deep scan
-                github = GitHubLookup()
-                results = await self._run_module(
+                github = modules.GitHubLookup()
+                async for batch in self._run_module(
                     github, username, depth, root_id, log, on_finding
-                )
-                for finding in results:
-                    yield finding
+                ):
+                    for finding in batch:
+                        yield finding
                 await asyncio.sleep(0.5)
 
                 # GitHub secrets scanner
-                secrets = GitHubSecrets()
-                results = await self._run_module(
+                secrets = modules.GitHubSecrets()
+                async for batch in self._run_module(
                     secrets, username, depth, root_id, log, on_finding
-                )
-                for finding in results:
-                    yield finding
+                ):
+                    for finding in batch:
+                        yield finding
                 await asyncio.sleep(0.5)
 
                 # Social media deep dive
                 for platform in ["reddit", "twitter", "github"]:
-                    deep = SocialDeepDive()
+                    deep = modules.SocialDeepDive()
                     seed = f"{platform}:{username}"
-                    results = await self._run_module(
+                    async for batch in self._run_module(
                         deep, seed, depth, root_id, log, on_finding
-                    )
-                    for finding in results:
-                        yield finding
+                    ):
+                        for finding in batch:
+                            yield finding
                     await asyncio.sleep(0.3)
 
             # Wayback Machine search for found URLs
             if self.found_urls:
                 log("")
                 log("--- Checking Archive.org ---")
-                wayback = WaybackLookup()
+                wayback = modules.WaybackLookup()
 
                 for url in list(set(self.found_urls))[:5]:
-                    results = await self._run_module(
+                    async for batch in self._run_module(
                         wayback, url, depth, root_id, log, on_finding
-                    )
-                    for finding in results:
-                        yield finding
+                    ):
+                        for finding in batch:
+                            yield finding
                     await asyncio.sleep(0.5)
 
         # ==================== HOP 3 ====================
@@ -344,38 +315,38 @@ class ScanOrchestrator:
 
             # Data broker warnings
             log("--- Data Broker Exposure Check ---")
-            broker = DataBrokerCheck()
-            results = await self._run_module(
+            broker = modules.DataBrokerCheck()
+            async for batch in self._run_module(
                 broker, email, depth, root_id, log, on_finding
-            )
-            for finding in results:
-                yield finding
+            ):
+                for finding in batch:
+                    yield finding
 
             # Location inference
             if self.locations:
                 log("--- Aggregating Location Data ---")
-                location = LocationInference()
+                location = modules.LocationInference()
                 seed_data = json.dumps(self.locations)
-                results = await self._run_module(
+                async for batch in self._run_module(
                     location, seed_data, depth, root_id, log, on_finding
-                )
-                for finding in results:
-                    yield finding
+                ):
+                    for finding in batch:
+                        yield finding
 
             # Connected accounts correlation
             if self.usernames or self.bios:
                 log("--- Cross-Platform Correlation ---")
-                connector = ConnectedAccountFinder()
+                connector = modules.ConnectedAccountFinder()
                 seed_data = json.dumps({
                     "usernames": list(self.usernames),
                     "bios": self.bios,
                     "found_accounts": self.found_accounts,
                 })
-                results = await self._run_module(
+                async for batch in self._run_module(
                     connector, seed_data, depth, root_id, log, on_finding
-                )
-                for finding in results:
-                    yield finding
+                ):
+                    for finding in batch:
+                        yield finding
 
         # ==================== COMPLETION ====================
         elapsed = time.time() - self.start_time
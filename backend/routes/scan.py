@@ -1,8 +1,8 @@
 """Scan endpoint with SSE streaming."""
 
 import asyncio
-import json
 import time
+import orjson
 from fastapi import APIRouter, Query, HTTPException
 from fastapi.responses import StreamingResponse
 
@@ -13,6 +13,11 @@ from config import settings
 
 router = APIRouter(tags=["Scan"])
 
+# Same wire format as json.dumps(data, default=str): datetimes go through
+# str() ("YYYY-MM-DD HH:MM:SS.ffffff") rather than orjson's ISO-8601, and
+# int keys in module data dicts (e.g. hour histograms) become strings.
+_JSON_OPTS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
 
 @router.get("/scan")
 async def scan(
@@ -61,7 +66,7 @@ async def scan(
 
         def send_event(event_type: str, data: dict) -> str:
             """Format SSE event."""
-            json_data = json.dumps(data, default=str)
+            json_data = orjson.dumps(data, default=str, option=_JSON_OPTS).decode()
             return f"event: {event_type}\ndata: {json_data}\n\n"
 
         try:
@@ -79,7 +84,7 @@ async def scan(
                 # Send finding event
                 yield send_event("finding", {
                     "type": "finding",
-                    "finding": finding.model_dump(),
+                    "finding": finding.model_dump(mode="python"),
                 })
 
                 # Send progress event
@@ -142,7 +147,7 @@ async def scan_demo():
         orchestrator = ScanOrchestrator()
 
         def send_event(event_type: str, data: dict) -> str:
-            json_data = json.dumps(data, default=str)
+            json_data = orjson.dumps(data, default=str, option=_JSON_OPTS).decode()
             return f"event: {event_type}\ndata: {json_data}\n\n"
 
         yield send_event("start", {"type": "start", "depth": 2})
@@ -150,7 +155,7 @@ async def scan_demo():
         async for finding in orchestrator.run(demo_email, depth=2):
             yield send_event("finding", {
                 "type": "finding",
-                "finding": finding.model_dump(),
+                "finding": finding.model_dump(mode="python"),
             })
             await asyncio.sleep(0.3)  # Slower for demo visibility
 
@@ -1,9 +1,13 @@
 from .headers import SecurityHeadersMiddleware
+from .cors import CachedCORSMiddleware
+from .compression import CompressionMiddleware
 from .rate_limit import verify_request_limiter, verify_attempt_limiter, scan_limiter
 from .verification import verification_store
 
 __all__ = [
     "SecurityHeadersMiddleware",
+    "CachedCORSMiddleware",
+    "CompressionMiddleware",
     "verify_request_limiter",
     "verify_attempt_limiter",
     "scan_limiter",
@@ -0,0 +1,21 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import Receive, Scope, Send
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """GZip for regular responses, bypassed for SSE streams.
+
+    Starlette's streaming gzip does not flush per chunk, so compressing a
+    text/event-stream response would hold scan events back until the
+    compressor's buffer fills.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            accept = Headers(scope=scope).get("accept", "")
+            if "text/event-stream" in accept:
+                await self.app(scope, receive, send)
+                return
+
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,24 @@
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+class CachedCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with O(1) origin checks.
+
+    Starlette already precomputes the preflight/simple header values at init,
+    but keeps allowed origins as a list and scans it on every cross-origin
+    request. Freeze the origins into a set once instead.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins=(), **kwargs) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins_set = frozenset(self.allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins:
+            return True
+
+        if self.allow_origin_regex is not None and self.allow_origin_regex.fullmatch(origin):
+            return True
+
+        return origin in self.allow_origins_set
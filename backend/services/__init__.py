@@ -1,3 +1,11 @@
 from .email import email_service
+from .http import get_http_client, close_http_client
+from .upstream import (
+    CHECK_DEADLINE, HostThrottle, SingleFlight, TTLCache, UPSTREAM_FAILED, within_deadline,
+)
 
-__all__ = ["email_service"]
+__all__ = [
+    "email_service", "get_http_client", "close_http_client",
+    "CHECK_DEADLINE", "HostThrottle", "SingleFlight", "TTLCache", "UPSTREAM_FAILED",
+    "within_deadline",
+]
@@ -0,0 +1,31 @@
+"""Shared outbound HTTP client.
+
+One pooled AsyncClient per process so OSINT modules reuse TCP/TLS
+connections (and HTTP/2 streams) across lookups instead of handshaking
+on every call.
+"""
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(15.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+            headers={"User-Agent": "TRACE-OSINT/1.0"},
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
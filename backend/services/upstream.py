@@ -0,0 +1,156 @@
+"""Shared plumbing for calling rate-limited upstream services.
+
+Per-host throttling driven by rate-limit response headers, a bounded TTL
+cache and single-flight request coalescing. Each OSINT module keeps its
+own instances (limits, TTLs and keys differ) on this one implementation.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Hashable
+
+import httpx
+
+# Set when an upstream request made by the current task failed (connection
+# error, or a 429/5xx the caller gave up on); such results are not cached
+UPSTREAM_FAILED: ContextVar[bool] = ContextVar("upstream_failed", default=False)
+
+# Loop time at which the current task's check times out; retries whose
+# wait would run past it give up instead
+CHECK_DEADLINE: ContextVar[float] = ContextVar("check_deadline", default=float("inf"))
+
+
+def within_deadline(wait: float) -> bool:
+    """True if waiting this many seconds still leaves the current check inside its deadline."""
+    return asyncio.get_running_loop().time() + wait < CHECK_DEADLINE.get()
+
+
+def _header_seconds(value: str) -> float:
+    """Seconds to wait from a delta or epoch header value (1s if unparseable)."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        return 1.0
+    # Large values are epoch timestamps (x-ratelimit-reset), small ones deltas
+    return seconds - time.time() if seconds > 1e9 else seconds
+
+
+def rate_limit_wait(resp: httpx.Response, low_water: int = 0) -> float:
+    """
+    Seconds a response asks callers to hold off (0 when it does not).
+
+    Retry-After wins; otherwise X-RateLimit-Reset applies once
+    X-RateLimit-Remaining has dropped to low_water or below.
+    """
+    retry_after = resp.headers.get("retry-after")
+    if retry_after is not None:
+        return _header_seconds(retry_after)
+
+    remaining = resp.headers.get("x-ratelimit-remaining")
+    if remaining is not None and remaining.isdigit() and int(remaining) <= low_water:
+        return _header_seconds(resp.headers.get("x-ratelimit-reset", "1"))
+    return 0.0
+
+
+class HostThrottle:
+    """
+    Per-host concurrency cap plus the backoff each host asked for.
+
+    Hosts with quota left are never delayed; a host whose response says
+    the quota is spent is held back for at most max_wait seconds.
+    """
+
+    def __init__(self, per_host: int, max_wait: float = 5.0, low_water: int = 0):
+        self.per_host = per_host
+        self.max_wait = max_wait
+        self.low_water = low_water
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        # Earliest time (monotonic) each host may be called again
+        self._ready_at: dict[str, float] = {}
+
+    def ready_in(self, host: str) -> float:
+        """Seconds until the host may be called again (<= 0 when it may now)."""
+        return self._ready_at.get(host, 0.0) - time.monotonic()
+
+    def note(self, host: str, resp: httpx.Response):
+        """Hold a host back when its response says the quota is spent."""
+        wait = rate_limit_wait(resp, self.low_water)
+        if wait > 0:
+            ready_at = time.monotonic() + min(wait, self.max_wait)
+            self._ready_at[host] = max(self._ready_at.get(host, 0.0), ready_at)
+
+    @asynccontextmanager
+    async def slot(self, host: str):
+        """Hold the host's semaphore, waiting out any backoff first."""
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        async with sem:
+            delay = self.ready_in(host)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                yield
+            except httpx.TransportError:
+                UPSTREAM_FAILED.set(True)
+                raise
+
+
+class TTLCache:
+    """
+    Bounded cache whose entries expire after a TTL.
+
+    When full, the oldest entry is evicted (FIFO); storing a key again
+    moves it to the back.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 4096):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (hit, value) for a live entry; an expired one is dropped."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return False, None
+        return True, entry[1]
+
+    def peek(self, key: Hashable) -> tuple[float, Any] | None:
+        """Return (expires_at, value) even past expiry, for revalidation or stale reads."""
+        return self._entries.get(key)
+
+    def put(self, key: Hashable, value: Any, ttl: float | None = None):
+        """Store a value for ttl seconds (the cache default if None)."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+
+class SingleFlight:
+    """Run one fetch per key at a time; identical concurrent calls share its result."""
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Await fetch(), or the call already in flight for key."""
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        inflight = self._inflight[key] = asyncio.get_running_loop().create_future()
+        result = None
+        try:
+            result = await fetch()
+        finally:
+            # Waiters get None if this fetch was cancelled or failed
+            del self._inflight[key]
+            inflight.set_result(result)
+        return result